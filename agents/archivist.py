@@ -3,32 +3,54 @@
 from __future__ import annotations
 
 import difflib
+import functools
 import hashlib
 import html
 import importlib
 import io
+import itertools
 import json
 import math
 import mimetypes
+import mmap
+import os
 import re
+import stat
 import xml.etree.ElementTree as ET
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, replace
 from multiprocessing import get_context
 from pathlib import Path, PurePosixPath
-from typing import Any, TypeVar, cast
+from typing import Any, BinaryIO, TypeVar, cast
 from zipfile import BadZipFile, ZipFile
 
 _ReportT = TypeVar("_ReportT")
 
 SUPPORTED_MANGA_IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp"}
 _NUMBER_PATTERN = re.compile(r"(\d+)")
+_SIDECAR_OCR_SUFFIX = ".ocr.txt"
+_SIDECAR_MMAP_MIN_BYTES = 1024 * 1024
+# OCR sidecar line: x1,y1,x2,y2|confidence|text
+_SIDECAR_REGION_PATTERN = re.compile(
+    r"\s*([+-]?\d+)\s*,\s*([+-]?\d+)\s*,\s*([+-]?\d+)\s*,\s*([+-]?\d+)\s*"
+    r"\|\s*([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)\s*\|(.*)"
+)
+# The same line matched on raw bytes, for sidecars with ASCII-only fields.
+_SIDECAR_REGION_BYTES_PATTERN = re.compile(_SIDECAR_REGION_PATTERN.pattern.encode())
+# Line breaks str.splitlines() honours but bytes.splitlines() does not.
+_SIDECAR_UNICODE_LINE_BREAK = re.compile(
+    rb"[\x0b\x0c\x1c-\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]"
+)
 _ZIP_SIGNATURES = (b"PK\x03\x04", b"PK\x05\x06", b"PK\x07\x08")
 _PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
 _JPEG_SIGNATURE = b"\xff\xd8\xff"
 _PDF_SIGNATURE = b"%PDF-"
 _WEBP_RIFF_SIGNATURE = b"RIFF"
 _WEBP_FORMAT_MARKER = b"WEBP"
+_WEBP_VP8X_EXIF_FLAG = 0x08
+_EXIF_ORIENTATION_TAG = 0x0112
+_EXIF_TRANSPOSED_ORIENTATIONS = {5, 6, 7, 8}
 
 _ALLOWED_MIME_TYPES: dict[str, set[str]] = {
     ".cbz": {
@@ -71,6 +93,8 @@ class IngestionPolicy:
     max_archive_uncompressed_bytes: int = 500 * 1024 * 1024
     max_compression_ratio: float = 100.0
     worker_timeout_seconds: float = 10.0
+    page_analysis_workers: int = 1
+    hash_algorithm: str = "sha256"
 
 
 DEFAULT_INGESTION_POLICY = IngestionPolicy()
@@ -94,7 +118,7 @@ class IngestionReport:
     page_metadata: tuple[MangaPageMetadata, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MangaPageMetadata:
     """Normalized metadata captured for a manga page."""
 
@@ -140,7 +164,7 @@ class TextIngestionReport:
     chunk_signatures: tuple[str, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OcrRegion:
     """Detected OCR region and dialogue classification."""
 
@@ -153,7 +177,7 @@ class OcrRegion:
     region_type: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OcrPageReport:
     """OCR output for a single manga page."""
 
@@ -336,37 +360,114 @@ def _validate_archive_limits(
     return sorted(page_names, key=_natural_sort_key)
 
 
-def _hash_bytes(payload: bytes) -> str:
-    return hashlib.sha256(payload).hexdigest()
+def _new_hash_builder(algorithm: str) -> Any:
+    if algorithm == "blake3":
+        blake3_module = importlib.import_module("blake3")
+        return blake3_module.blake3(max_threads=blake3_module.blake3.AUTO)
+    return hashlib.new(algorithm)
+
+
+def _hash_bytes(payload: bytes, algorithm: str = "sha256") -> str:
+    hash_builder = _new_hash_builder(algorithm)
+    hash_builder.update(payload)
+    return cast(str, hash_builder.hexdigest())
 
 
 def _clamp(value: float, *, min_value: float = 0.0, max_value: float = 1.0) -> float:
     return max(min_value, min(max_value, value))
 
 
-def _compute_file_hash(path: Path) -> str:
-    hash_builder = hashlib.sha256()
+def _compute_file_hash(path: Path, algorithm: str = "sha256") -> str:
+    hash_builder = _new_hash_builder(algorithm)
     with path.open("rb") as file_handle:
         while True:
             chunk = file_handle.read(1024 * 1024)
             if not chunk:
                 break
             hash_builder.update(chunk)
-    return hash_builder.hexdigest()
+    return cast(str, hash_builder.hexdigest())
+
+
+def _compute_folder_hash(
+    page_metadata: tuple[MangaPageMetadata, ...], algorithm: str = "sha256"
+) -> str:
+    """Fold per-page content hashes into a folder hash without re-reading pages.
 
+    Each page's ``content_hash`` is already the file hash, so this matches
+    hashing every file again while only costing a stat per page.
+    """
 
-def _compute_folder_hash(folder_path: Path) -> str:
-    hash_builder = hashlib.sha256()
-    page_paths = list_manga_image_pages(folder_path)
+    hash_builder = _new_hash_builder(algorithm)
 
+    for metadata in page_metadata:
+        page_name = os.path.basename(metadata.source_ref)
+        hash_builder.update(page_name.encode("utf-8"))
+        page_size = os.stat(metadata.source_ref).st_size
+        hash_builder.update(page_size.to_bytes(8, signed=False))
+        hash_builder.update(metadata.content_hash.encode("ascii"))
+
+    return cast(str, hash_builder.hexdigest())
+
+
+def compute_manga_folder_fingerprint(page_paths: list[Path]) -> str:
+    """Fingerprint a page listing from names, sizes, and mtimes only.
+
+    Unlike the ingestion source hash this never reads page content, so it is
+    cheap enough to probe for an already-imported folder before ingesting.
+    """
+
+    hash_builder = hashlib.blake2b(digest_size=16)
     for page_path in page_paths:
+        page_stat = os.stat(page_path, follow_symlinks=False)
         hash_builder.update(page_path.name.encode("utf-8"))
-        hash_builder.update(page_path.stat().st_size.to_bytes(8, signed=False))
-        hash_builder.update(_compute_file_hash(page_path).encode("ascii"))
-
+        hash_builder.update(page_stat.st_size.to_bytes(8, "little"))
+        hash_builder.update(page_stat.st_mtime_ns.to_bytes(8, "little"))
     return hash_builder.hexdigest()
 
 
+@functools.cache
+def _load_orjson_module() -> Any | None:
+    try:
+        return importlib.import_module("orjson")
+    except ImportError:
+        return None
+
+
+def _dump_json_bytes(
+    payload: Any, default: Callable[[Any], Any] | None = None
+) -> bytes:
+    """Encode ``payload`` as indented UTF-8 JSON, via orjson when installed.
+
+    orjson serializes dataclasses natively; ``default`` is only consulted for
+    objects the active encoder cannot handle itself.
+    """
+
+    orjson_module = _load_orjson_module()
+    if orjson_module is None:
+        return json.dumps(payload, indent=2, default=default).encode("utf-8")
+    return cast(
+        bytes,
+        orjson_module.dumps(
+            payload, default=default, option=orjson_module.OPT_INDENT_2
+        ),
+    )
+
+
+def _dump_json_line(payload: Any, default: Callable[[Any], Any] | None = None) -> bytes:
+    """Encode ``payload`` as one compact, newline-terminated JSON line."""
+
+    orjson_module = _load_orjson_module()
+    if orjson_module is None:
+        encoded = json.dumps(payload, separators=(",", ":"), default=default)
+        return encoded.encode("utf-8") + b"\n"
+    return cast(
+        bytes,
+        orjson_module.dumps(
+            payload, default=default, option=orjson_module.OPT_APPEND_NEWLINE
+        ),
+    )
+
+
 def _load_pillow_modules() -> tuple[Any, Any]:
     image_module = importlib.import_module("PIL.Image")
     image_ops_module = importlib.import_module("PIL.ImageOps")
@@ -507,9 +608,10 @@ def _analyze_manga_page_bytes(
     image_bytes: bytes,
     source_ref: str,
     spread_ratio_threshold: float = 1.35,
+    hash_algorithm: str = "sha256",
 ) -> MangaPageMetadata:
     image_module, image_ops_module = _load_pillow_modules()
-    source_hash = _hash_bytes(image_bytes)
+    source_hash = _hash_bytes(image_bytes, hash_algorithm)
 
     with image_module.open(io.BytesIO(image_bytes)) as raw_image:
         image_format = (raw_image.format or "unknown").lower()
@@ -1090,8 +1192,8 @@ def _natural_sort_key(value: str) -> tuple[object, ...]:
     return tuple(key)
 
 
-def _is_supported_manga_page(path: Path) -> bool:
-    return path.suffix.lower() in SUPPORTED_MANGA_IMAGE_EXTENSIONS
+def _is_supported_manga_page(file_name: str) -> bool:
+    return os.path.splitext(file_name)[1].lower() in SUPPORTED_MANGA_IMAGE_EXTENSIONS
 
 
 def list_manga_image_pages(folder_path: Path) -> list[Path]:
@@ -1100,12 +1202,65 @@ def list_manga_image_pages(folder_path: Path) -> list[Path]:
     if not folder_path.exists() or not folder_path.is_dir():
         return []
 
-    pages = [
-        path
-        for path in folder_path.iterdir()
-        if path.is_file() and _is_supported_manga_page(path)
-    ]
-    return sorted(pages, key=lambda path: _natural_sort_key(path.name))
+    with os.scandir(folder_path) as entries:
+        decorated = [
+            (_natural_sort_key(entry.name), entry.path)
+            for entry in entries
+            if entry.is_file() and _is_supported_manga_page(entry.name)
+        ]
+    decorated.sort()
+    return [Path(entry_path) for _, entry_path in decorated]
+
+
+def _analyze_manga_page_file(
+    page_path: Path, hash_algorithm: str = "sha256"
+) -> MangaPageMetadata:
+    return _analyze_manga_page_bytes(
+        page_path.read_bytes(),
+        source_ref=str(page_path),
+        hash_algorithm=hash_algorithm,
+    )
+
+
+def _analyze_manga_page_files(
+    pages: list[Path],
+    policy: IngestionPolicy,
+) -> list[MangaPageMetadata]:
+    """Analyze pages in order, fanning out to a process pool when configured.
+
+    Workers read and decode their own pages and return only the metadata
+    record, so decoded pixels never cross the process boundary.
+    """
+
+    worker_count = min(policy.page_analysis_workers, len(pages))
+    if worker_count <= 1:
+        return [
+            _analyze_manga_page_file(page_path, policy.hash_algorithm)
+            for page_path in pages
+        ]
+
+    # Deferred: the process-pool module pulls in multiprocessing's connection
+    # and queue machinery, which single-worker ingestion and OCR never need.
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunk_size = max(1, len(pages) // (4 * worker_count))
+    with ProcessPoolExecutor(
+        max_workers=worker_count, mp_context=get_context("spawn")
+    ) as executor:
+        try:
+            return list(
+                executor.map(
+                    _analyze_manga_page_file,
+                    pages,
+                    itertools.repeat(policy.hash_algorithm),
+                    timeout=policy.worker_timeout_seconds,
+                    chunksize=chunk_size,
+                )
+            )
+        except TimeoutError:
+            # Otherwise leaving the block waits for every queued chunk.
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
 
 
 def _ingest_image_folder_pages_worker(
@@ -1114,7 +1269,6 @@ def _ingest_image_folder_pages_worker(
 ) -> IngestionReport:
     pages = list_manga_image_pages(folder_path)
     warnings: list[str] = []
-    page_metadata: list[MangaPageMetadata] = []
 
     if len(pages) > policy.max_page_count:
         msg = (
@@ -1126,9 +1280,7 @@ def _ingest_image_folder_pages_worker(
         _validate_file_size(page_path, policy)
         _validate_extension_mime_and_signature(page_path)
 
-        page_bytes = page_path.read_bytes()
-        metadata = _analyze_manga_page_bytes(page_bytes, source_ref=str(page_path))
-        page_metadata.append(metadata)
+    page_metadata = _analyze_manga_page_files(pages, policy)
 
     if not pages:
         warnings.append("No supported manga image pages found.")
@@ -1165,7 +1317,11 @@ def _ingest_cbz_pages_worker(
                 with cbz_archive.open(page_name) as member_file:
                     page_bytes = member_file.read()
 
-                metadata = _analyze_manga_page_bytes(page_bytes, source_ref=page_name)
+                metadata = _analyze_manga_page_bytes(
+                    page_bytes,
+                    source_ref=page_name,
+                    hash_algorithm=policy.hash_algorithm,
+                )
                 page_metadata.append(metadata)
     except BadZipFile as error:
         msg = f"CBZ archive '{archive_path.name}' is invalid: {error}."
@@ -1208,6 +1364,11 @@ def _run_in_sandboxed_worker(
     timeout_seconds: float,
     expected_type: type[_ReportT],
 ) -> _ReportT:
+    if timeout_seconds <= 0:
+        # A non-positive budget can never be met; skip the process spawn.
+        msg = f"Sandbox worker for '{task_name}' exceeded timeout ({timeout_seconds}s)."
+        raise TimeoutError(msg)
+
     context = get_context("spawn")
     result_queue = context.Queue()
     worker = context.Process(
@@ -1255,66 +1416,173 @@ def _classify_dialogue_region(text: str) -> str:
     return "speech"
 
 
+def _probe_header_dimensions(file_handle: BinaryIO) -> tuple[int, int] | None:
+    """Read PNG/WebP dimensions from the file headers without decoding.
+
+    Returns ``None`` when the header is truncated, not recognized, or may carry
+    an EXIF orientation (JPEG, WebP with an EXIF chunk, PNG with an ``eXIf``
+    chunk), so callers fall back to PIL.
+    """
+
+    file_header = file_handle.read(32)
+
+    if file_header.startswith(_PNG_SIGNATURE):
+        if len(file_header) < 24 or file_header[12:16] != b"IHDR":
+            return None
+        if _png_may_carry_exif(file_handle):
+            return None
+        width = int.from_bytes(file_header[16:20], "big")
+        height = int.from_bytes(file_header[20:24], "big")
+        return width, height
+
+    if len(file_header) < 30 or _sniff_binary_signature(file_header) != "webp":
+        return None
+
+    chunk_type = file_header[12:16]
+    if chunk_type == b"VP8 " and file_header[23:26] == b"\x9d\x01\x2a":
+        width = int.from_bytes(file_header[26:28], "little") & 0x3FFF
+        height = int.from_bytes(file_header[28:30], "little") & 0x3FFF
+        return width, height
+    if chunk_type == b"VP8L" and file_header[20:21] == b"\x2f":
+        bits = int.from_bytes(file_header[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk_type == b"VP8X" and not file_header[20] & _WEBP_VP8X_EXIF_FLAG:
+        width = int.from_bytes(file_header[24:27], "little") + 1
+        height = int.from_bytes(file_header[27:30], "little") + 1
+        return width, height
+
+    return None
+
+
+def _png_may_carry_exif(file_handle: BinaryIO) -> bool:
+    """Report whether an ``eXIf`` chunk may precede the first ``IDAT``.
+
+    Only the 8-byte length/type header of each chunk is read; chunk bodies
+    are skipped with seek. A truncated chunk list cannot rule EXIF out, so
+    the caller defers to PIL.
+    """
+
+    offset = len(_PNG_SIGNATURE)
+    while True:
+        file_handle.seek(offset)
+        chunk_header = file_handle.read(8)
+        if len(chunk_header) < 8:
+            return True
+        chunk_type = chunk_header[4:8]
+        if chunk_type == b"IDAT":
+            return False
+        if chunk_type == b"eXIf":
+            return True
+        # length + type + data + CRC
+        offset += 12 + int.from_bytes(chunk_header[:4], "big")
+
+
 def _page_dimensions(image_path: Path) -> tuple[int, int]:
-    image_module, image_ops_module = _load_pillow_modules()
+    with image_path.open("rb") as file_handle:
+        probed_dimensions = _probe_header_dimensions(file_handle)
+    if probed_dimensions is not None:
+        return probed_dimensions
+
+    # Image.open only parses headers; honour EXIF rotation without decoding.
+    image_module, _ = _load_pillow_modules()
     with image_module.open(image_path) as raw_image:
-        normalized_image = image_ops_module.exif_transpose(raw_image)
-        return cast(tuple[int, int], normalized_image.size)
+        width, height = raw_image.size
+        orientation = raw_image.getexif().get(_EXIF_ORIENTATION_TAG, 1)
+
+    if orientation in _EXIF_TRANSPOSED_ORIENTATIONS:
+        return height, width
+    return width, height
+
+
+def _sidecar_ocr_path(image_path: Path) -> Path:
+    # Appending to the name skips with_suffix's suffix parsing and validation.
+    return image_path.with_name(image_path.name + _SIDECAR_OCR_SUFFIX)
+
+
+def _iter_sidecar_lines(sidecar_path: Path, sidecar_size: int) -> Iterator[bytes]:
+    if sidecar_size < _SIDECAR_MMAP_MIN_BYTES:
+        yield from sidecar_path.read_bytes().splitlines()
+        return
+
+    # Large OCR dumps are mapped and walked line by line rather than copied
+    # whole; readline splits on b"\n" only, so re-split for bare b"\r".
+    with (
+        sidecar_path.open("rb") as sidecar_file,
+        mmap.mmap(sidecar_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+    ):
+        for chunk in iter(mapped.readline, b""):
+            yield from chunk.splitlines()
 
 
 def _parse_sidecar_ocr_regions(image_path: Path) -> list[OcrRegion]:
-    sidecar_path = image_path.with_suffix(f"{image_path.suffix}.ocr.txt")
-    if not sidecar_path.exists() or not sidecar_path.is_file():
+    sidecar_path = _sidecar_ocr_path(image_path)
+    try:
+        sidecar_stat = sidecar_path.stat()
+    except OSError:
+        return []
+    if not stat.S_ISREG(sidecar_stat.st_mode):
         return []
 
-    page_width, page_height = _page_dimensions(image_path)
+    # Only unstructured lines need the page size; most sidecars have none.
+    page_size: tuple[int, int] | None = None
     regions: list[OcrRegion] = []
 
-    for line in sidecar_path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line:
+    for raw_line in _iter_sidecar_lines(sidecar_path, sidecar_stat.st_size):
+        raw_line = raw_line.strip()
+        if not raw_line:
             continue
 
-        # Format: x1,y1,x2,y2|confidence|text
-        parts = line.split("|", maxsplit=2)
-        if len(parts) == 3 and "," in parts[0]:
-            coordinate_values = [value.strip() for value in parts[0].split(",")]
-            if len(coordinate_values) == 4:
-                try:
-                    x1, y1, x2, y2 = [int(value) for value in coordinate_values]
-                    confidence = _clamp_confidence(float(parts[1]))
-                    text = parts[2].strip()
-                    if text:
-                        regions.append(
-                            OcrRegion(
-                                x1=x1,
-                                y1=y1,
-                                x2=x2,
-                                y2=y2,
-                                text=text,
-                                confidence=confidence,
-                                region_type=_classify_dialogue_region(text),
-                            )
-                        )
-                        continue
-                except ValueError:
-                    pass
+        # Fast path: ASCII coordinates and confidence, only the text decoded.
+        if _SIDECAR_UNICODE_LINE_BREAK.search(raw_line) is None:
+            byte_match = _SIDECAR_REGION_BYTES_PATTERN.fullmatch(raw_line)
+            if byte_match is not None:
+                text = byte_match[6].decode("utf-8").strip()
+                if text:
+                    regions.append(_sidecar_region(byte_match, text))
+                    continue
+
+        # Unicode whitespace, digits or line breaks need the str pattern.
+        for line in raw_line.decode("utf-8").splitlines():
+            line = line.strip()
+            if not line:
+                continue
 
-        regions.append(
-            OcrRegion(
-                x1=0,
-                y1=0,
-                x2=page_width,
-                y2=page_height,
-                text=line,
-                confidence=0.65,
-                region_type=_classify_dialogue_region(line),
+            match = _SIDECAR_REGION_PATTERN.fullmatch(line)
+            if match is not None:
+                text = match[6].strip()
+                if text:
+                    regions.append(_sidecar_region(match, text))
+                    continue
+
+            if page_size is None:
+                page_size = _page_dimensions(image_path)
+            regions.append(
+                OcrRegion(
+                    x1=0,
+                    y1=0,
+                    x2=page_size[0],
+                    y2=page_size[1],
+                    text=line,
+                    confidence=0.65,
+                    region_type=_classify_dialogue_region(line),
+                )
             )
-        )
 
     return regions
 
 
+def _sidecar_region(match: re.Match[bytes] | re.Match[str], text: str) -> OcrRegion:
+    return OcrRegion(
+        x1=int(match[1]),
+        y1=int(match[2]),
+        x2=int(match[3]),
+        y2=int(match[4]),
+        text=text,
+        confidence=_clamp_confidence(float(match[5])),
+        region_type=_classify_dialogue_region(text),
+    )
+
+
 def _run_primary_ocr_regions(image_path: Path) -> list[OcrRegion]:
     pytesseract_module = importlib.import_module("pytesseract")
     image_module, image_ops_module = _load_pillow_modules()
@@ -1364,46 +1632,71 @@ def _average_ocr_confidence(regions: list[OcrRegion]) -> float:
     return sum(region.confidence for region in regions) / len(regions)
 
 
-def extract_ocr_from_manga_page(
+def _run_primary_ocr_regions_batch(
+    image_paths: list[Path],
+) -> list[list[OcrRegion] | Exception]:
+    """Run primary OCR for a group of pages, returning failures per page.
+
+    This is the seam for engines that accept several images per call;
+    tesseract has no batched entry point, so pages run one after another.
+    """
+
+    results: list[list[OcrRegion] | Exception] = []
+    for image_path in image_paths:
+        try:
+            results.append(_run_primary_ocr_regions(image_path))
+        except Exception as error:  # noqa: BLE001
+            results.append(error)
+    return results
+
+
+def _build_ocr_page_report(
     image_path: Path,
+    primary_result: list[OcrRegion] | Exception,
     *,
-    min_confidence: float = 0.6,
-    use_ensemble: bool = True,
+    min_confidence: float,
+    use_ensemble: bool,
 ) -> OcrPageReport:
-    """Extract OCR regions for one page with fallback support."""
-
     warnings: list[str] = []
 
     primary_regions: list[OcrRegion] = []
-    try:
-        primary_regions = _run_primary_ocr_regions(image_path)
-    except Exception as error:  # noqa: BLE001
-        warnings.append(f"Primary OCR unavailable; fallback used ({error}).")
+    if isinstance(primary_result, Exception):
+        warnings.append(f"Primary OCR unavailable; fallback used ({primary_result}).")
+    else:
+        primary_regions = primary_result
 
     primary_confidence = _average_ocr_confidence(primary_regions)
     fallback_regions: list[OcrRegion] = []
+    fallback_confidence = 0.0
 
     should_try_fallback = (not primary_regions) or (primary_confidence < min_confidence)
     if should_try_fallback:
         fallback_regions = _parse_sidecar_ocr_regions(image_path)
+        fallback_confidence = _average_ocr_confidence(fallback_regions)
         if fallback_regions and primary_regions:
             warnings.append("Primary OCR confidence low; combined with fallback OCR.")
 
+    # Each region list is averaged once; the selected average is reused.
     if use_ensemble and primary_regions and fallback_regions:
-        if _average_ocr_confidence(fallback_regions) > primary_confidence:
+        if fallback_confidence > primary_confidence:
             selected_regions = fallback_regions
+            selected_confidence = fallback_confidence
             engine = "ensemble-fallback"
         else:
             selected_regions = primary_regions
+            selected_confidence = primary_confidence
             engine = "ensemble-primary"
     elif fallback_regions:
         selected_regions = fallback_regions
+        selected_confidence = fallback_confidence
         engine = "sidecar"
     elif primary_regions:
         selected_regions = primary_regions
+        selected_confidence = primary_confidence
         engine = "pytesseract"
     else:
         selected_regions = []
+        selected_confidence = 0.0
         engine = "none"
         warnings.append("No OCR text extracted from this page.")
 
@@ -1411,59 +1704,134 @@ def extract_ocr_from_manga_page(
         source_path=image_path,
         engine=engine,
         regions=tuple(selected_regions),
-        average_confidence=_clamp_confidence(_average_ocr_confidence(selected_regions)),
+        average_confidence=_clamp_confidence(selected_confidence),
         warnings=tuple(warnings),
     )
 
 
+def extract_ocr_from_manga_page(
+    image_path: Path,
+    *,
+    min_confidence: float = 0.6,
+    use_ensemble: bool = True,
+) -> OcrPageReport:
+    """Extract OCR regions for one page with fallback support."""
+
+    primary_result: list[OcrRegion] | Exception
+    try:
+        primary_result = _run_primary_ocr_regions(image_path)
+    except Exception as error:  # noqa: BLE001
+        primary_result = error
+
+    return _build_ocr_page_report(
+        image_path,
+        primary_result,
+        min_confidence=min_confidence,
+        use_ensemble=use_ensemble,
+    )
+
+
 def extract_ocr_for_manga_pages(
     page_paths: list[Path],
     *,
     min_confidence: float = 0.6,
     use_ensemble: bool = True,
+    max_workers: int | None = None,
+    batch_size: int = 16,
 ) -> tuple[OcrPageReport, ...]:
-    """Extract OCR reports for a batch of manga pages."""
+    """Extract OCR reports for a batch of manga pages, preserving page order.
+
+    Pages are grouped into primary-OCR batches of at most ``batch_size`` and
+    the batches run on a thread pool: sidecar reads and the tesseract
+    subprocess both release the GIL, so threads overlap the I/O without the
+    pickling cost of a process pool. Batches shrink for small inputs so every
+    worker still gets pages.
+    """
+
+    worker_limit = max_workers or 32
+    batch_length = max(1, min(batch_size, -(-len(page_paths) // worker_limit)))
+    batches = [
+        page_paths[start : start + batch_length]
+        for start in range(0, len(page_paths), batch_length)
+    ]
 
-    reports = [
-        extract_ocr_from_manga_page(
-            page_path,
-            min_confidence=min_confidence,
-            use_ensemble=use_ensemble,
+    def extract_batch(batch: list[Path]) -> list[OcrPageReport]:
+        primary_results = _run_primary_ocr_regions_batch(batch)
+        return [
+            _build_ocr_page_report(
+                page_path,
+                primary_result,
+                min_confidence=min_confidence,
+                use_ensemble=use_ensemble,
+            )
+            for page_path, primary_result in zip(batch, primary_results, strict=True)
+        ]
+
+    worker_count = min(worker_limit, len(batches))
+    if worker_count <= 1:
+        return tuple(report for batch in batches for report in extract_batch(batch))
+
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        return tuple(
+            report
+            for batch_reports in executor.map(extract_batch, batches)
+            for report in batch_reports
         )
-        for page_path in page_paths
-    ]
-    return tuple(reports)
+
+
+def _ocr_region_json(value: Any) -> dict[str, Any]:
+    if not isinstance(value, OcrRegion):
+        msg = f"Object of type {type(value).__name__} is not JSON serializable"
+        raise TypeError(msg)
+    return {
+        "x1": value.x1,
+        "y1": value.y1,
+        "x2": value.x2,
+        "y2": value.y2,
+        "text": value.text,
+        "confidence": value.confidence,
+        "region_type": value.region_type,
+    }
+
+
+def _ocr_page_payload(report: OcrPageReport) -> dict[str, Any]:
+    # Tuples and regions are passed through as-is; the encoders handle them.
+    return {
+        "source_path": str(report.source_path),
+        "engine": report.engine,
+        "average_confidence": report.average_confidence,
+        "warnings": report.warnings,
+        "regions": report.regions,
+    }
 
 
 def save_ocr_reports(reports: tuple[OcrPageReport, ...], output_path: Path) -> None:
     """Store OCR reports as JSON with coordinates and confidence values."""
 
-    payload = {
-        "pages": [
-            {
-                "source_path": str(report.source_path),
-                "engine": report.engine,
-                "average_confidence": report.average_confidence,
-                "warnings": list(report.warnings),
-                "regions": [
-                    {
-                        "x1": region.x1,
-                        "y1": region.y1,
-                        "x2": region.x2,
-                        "y2": region.y2,
-                        "text": region.text,
-                        "confidence": region.confidence,
-                        "region_type": region.region_type,
-                    }
-                    for region in report.regions
-                ],
-            }
-            for report in reports
-        ]
-    }
+    # One encoder call for the whole document.
+    payload = {"pages": [_ocr_page_payload(report) for report in reports]}
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(_dump_json_bytes(payload, default=_ocr_region_json))
+
+
+def save_ocr_reports_ndjson(
+    reports: tuple[OcrPageReport, ...], output_path: Path
+) -> None:
+    """Append OCR reports as newline-delimited JSON, one page per line.
+
+    Unlike :func:`save_ocr_reports` the file is never rewritten, so long OCR
+    jobs can persist pages incrementally and resume from what is on disk.
+    """
+
+    lines = b"".join(
+        _dump_json_line(_ocr_page_payload(report), default=_ocr_region_json)
+        for report in reports
+    )
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    with output_path.open("ab") as output_file:
+        output_file.write(lines)
 
 
 _SANDBOX_TASKS: dict[str, Callable[[Path, IngestionPolicy], object]] = {
@@ -1500,7 +1868,7 @@ def ingest_image_folder_pages(
     else:
         report = _ingest_image_folder_pages_worker(folder_path, policy)
 
-    source_hash = _compute_folder_hash(folder_path)
+    source_hash = _compute_folder_hash(report.page_metadata, policy.hash_algorithm)
     if idempotent:
         return _apply_page_dedupe(report, source_hash, dedupe_cache)
 
@@ -1534,7 +1902,7 @@ def ingest_cbz_pages(
     else:
         report = _ingest_cbz_pages_worker(archive_path, policy)
 
-    source_hash = _compute_file_hash(archive_path)
+    source_hash = _compute_file_hash(archive_path, policy.hash_algorithm)
     if idempotent:
         return _apply_page_dedupe(report, source_hash, dedupe_cache)
 
@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 import json
+import operator
+import os
 import time
+from array import array
+from collections import defaultdict, deque
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from enum import Enum
+from functools import partial
+from itertools import repeat
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +23,11 @@ def _timestamp() -> str:
     return datetime.now(UTC).isoformat()
 
 
+def _format_timestamp(epoch_seconds: float) -> str:
+    """Render an epoch-seconds timestamp as ISO-8601 for reports."""
+    return datetime.fromtimestamp(epoch_seconds, UTC).isoformat()
+
+
 def _generate_run_id() -> str:
     return datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
 
@@ -41,7 +53,7 @@ class BenchmarkMetricType(Enum):
     MEMORY = "memory_mb"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BenchmarkCase:
     """Single benchmark test case."""
 
@@ -54,7 +66,7 @@ class BenchmarkCase:
     timeout_seconds: float = 60.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BenchmarkResult:
     """Result of running a benchmark case."""
 
@@ -63,33 +75,35 @@ class BenchmarkResult:
     value: float
     passed: bool
     duration_ms: float
-    timestamp: str
+    timestamp: float  # Epoch seconds
     metadata: dict[str, str] = field(default_factory=dict)
     error: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BenchmarkRun:
     """Complete benchmark run with multiple cases."""
 
     run_id: str
-    timestamp: str
+    timestamp: float  # Epoch seconds
     results: tuple[BenchmarkResult, ...]
     duration_ms: float
     git_commit: str | None = None
     branch: str = "main"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TrendLine:
     """Trend line for a benchmark metric over time."""
 
     case_id: str
-    values: list[tuple[str, float]]  # (timestamp, value) pairs
+    values: array[float]  # Metric values, oldest first (typecode "d")
     slope: float  # Positive = getting worse, Negative = improving
     r_squared: float  # Goodness of fit
     alert_threshold: float
     is_regressing: bool
+    # Epoch seconds, parallel to values
+    timestamps: array[float] = field(default_factory=lambda: array("d"))
 
 
 # Define comprehensive benchmark suites
@@ -261,22 +275,90 @@ DEFAULT_BENCHMARKS: tuple[BenchmarkCase, ...] = (
     ),
 )
 
+BENCHMARK_BY_ID: dict[str, BenchmarkCase] = {b.case_id: b for b in DEFAULT_BENCHMARKS}
+DEFAULT_BENCHMARK_IDS: frozenset[str] = frozenset(BENCHMARK_BY_ID)
+DEFAULT_BENCHMARK_CATEGORIES: frozenset[BenchmarkCategory] = frozenset(
+    b.category for b in DEFAULT_BENCHMARKS
+)
+BENCHMARKS_BY_CATEGORY: dict[BenchmarkCategory, tuple[BenchmarkCase, ...]] = {
+    category: tuple(b for b in DEFAULT_BENCHMARKS if b.category == category)
+    for category in BenchmarkCategory
+}
+
+# Pass/fail comparison per metric: lower is better for latency and memory,
+# higher is better for everything else.
+_PASS_CHECKS: dict[BenchmarkMetricType, Callable[[float, float], bool]] = {
+    metric_type: (
+        operator.le
+        if metric_type in (BenchmarkMetricType.LATENCY, BenchmarkMetricType.MEMORY)
+        else operator.ge
+    )
+    for metric_type in BenchmarkMetricType
+}
+
+
+def _measure_benchmark(
+    benchmark: BenchmarkCase,
+    run_func: Callable[[], float],
+    run_id: str,
+    metadata: dict[str, str] | None = None,
+) -> BenchmarkResult:
+    """Time ``run_func`` and judge its value against the benchmark target."""
+    start_time = time.perf_counter()
+
+    try:
+        value = run_func()
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        passed = _PASS_CHECKS[benchmark.metric_type](value, benchmark.target_value)
+        return BenchmarkResult(
+            case_id=benchmark.case_id,
+            run_id=run_id,
+            value=value,
+            passed=passed,
+            duration_ms=duration_ms,
+            timestamp=time.time(),
+            metadata=metadata or {},
+        )
+    except Exception as e:
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        return BenchmarkResult(
+            case_id=benchmark.case_id,
+            run_id=run_id,
+            value=0.0,
+            passed=False,
+            duration_ms=duration_ms,
+            timestamp=time.time(),
+            metadata=metadata or {},
+            error=str(e),
+        )
+
 
 class BenchmarkRunner:
     """G10.1: Benchmark suite runner with trend tracking."""
 
     def __init__(self, storage_path: Path | None = None) -> None:
-        self._benchmarks: dict[str, BenchmarkCase] = {
-            b.case_id: b for b in DEFAULT_BENCHMARKS
+        self._benchmarks: dict[str, BenchmarkCase] = dict(BENCHMARK_BY_ID)
+        self._benchmarks_by_category: dict[
+            BenchmarkCategory, dict[str, BenchmarkCase]
+        ] = {
+            category: {b.case_id: b for b in benchmarks}
+            for category, benchmarks in BENCHMARKS_BY_CATEGORY.items()
         }
         self._runs: list[BenchmarkRun] = []
-        self._individual_results: dict[str, list[BenchmarkResult]] = {}  # For history
+        self._history_cap = 1024  # Oldest results are evicted past this
+        self._individual_results: defaultdict[str, deque[BenchmarkResult]] = (
+            defaultdict(lambda: deque(maxlen=self._history_cap))
+        )  # For history
         self._storage_path = storage_path or Path(".benchmarks")
         self._regression_threshold = 0.15  # 15% regression triggers alert
 
     def add_benchmark(self, benchmark: BenchmarkCase) -> None:
         """Add a custom benchmark case."""
+        previous = self._benchmarks.get(benchmark.case_id)
+        if previous is not None and previous.category != benchmark.category:
+            del self._benchmarks_by_category[previous.category][benchmark.case_id]
         self._benchmarks[benchmark.case_id] = benchmark
+        self._benchmarks_by_category[benchmark.category][benchmark.case_id] = benchmark
 
     def get_benchmark(self, case_id: str) -> BenchmarkCase | None:
         """Get a benchmark case by ID."""
@@ -286,10 +368,9 @@ class BenchmarkRunner:
         self, category: BenchmarkCategory | None = None
     ) -> list[BenchmarkCase]:
         """List benchmark cases, optionally filtered by category."""
-        benchmarks = list(self._benchmarks.values())
         if category:
-            benchmarks = [b for b in benchmarks if b.category == category]
-        return benchmarks
+            return list(self._benchmarks_by_category[category].values())
+        return list(self._benchmarks.values())
 
     def run_benchmark(
         self,
@@ -308,92 +389,110 @@ class BenchmarkRunner:
                 value=0.0,
                 passed=False,
                 duration_ms=0.0,
-                timestamp=_timestamp(),
+                timestamp=time.time(),
                 error=f"Benchmark {case_id} not found",
             )
 
-        run_id = run_id or _generate_run_id()
-        start_time = time.perf_counter()
-
-        try:
-            value = run_func()
-            duration_ms = (time.perf_counter() - start_time) * 1000
-
-            # Determine pass/fail based on metric type
-            if benchmark.metric_type in (
-                BenchmarkMetricType.LATENCY,
-                BenchmarkMetricType.MEMORY,
-            ):
-                passed = value <= benchmark.target_value
-            else:  # accuracy, success_rate
-                passed = value >= benchmark.target_value
-
-            result = BenchmarkResult(
-                case_id=case_id,
-                run_id=run_id,
-                value=value,
-                passed=passed,
-                duration_ms=duration_ms,
-                timestamp=_timestamp(),
-                metadata=metadata or {},
-            )
-            # Store for history tracking
-            self._individual_results.setdefault(case_id, []).append(result)
-            return result
-        except Exception as e:
-            duration_ms = (time.perf_counter() - start_time) * 1000
-            result = BenchmarkResult(
-                case_id=case_id,
-                run_id=run_id,
-                value=0.0,
-                passed=False,
-                duration_ms=duration_ms,
-                timestamp=_timestamp(),
-                metadata=metadata or {},
-                error=str(e),
-            )
-            self._individual_results.setdefault(case_id, []).append(result)
-            return result
+        result = _measure_benchmark(
+            benchmark, run_func, run_id or _generate_run_id(), metadata
+        )
+        # Store for history tracking
+        self._individual_results[case_id].append(result)
+        return result
 
     def run_suite(
         self,
         category: BenchmarkCategory | None = None,
         run_funcs: dict[str, Callable[[], float]] | None = None,
+        *,
+        parallel: bool = False,
+        max_workers: int | None = None,
     ) -> BenchmarkRun:
-        """Run a full benchmark suite."""
+        """Run a full benchmark suite.
+
+        With ``parallel=True`` the independent cases are dispatched to a thread
+        pool; results keep the suite order either way. Each case is still timed
+        individually, so CPU-bound run functions contend for the GIL and their
+        ``duration_ms`` reads higher than in a sequential run.
+        """
         run_id = _generate_run_id()
+        run_funcs = run_funcs or {}
         benchmarks = self.list_benchmarks(category)
-        results: list[BenchmarkResult] = []
+        # Cases without a run function use a mock value for testing; binding
+        # the target value with partial avoids late binding in the loop.
+        funcs: list[Callable[[], float]] = [
+            run_funcs.get(benchmark.case_id)
+            or partial(operator.mul, benchmark.target_value, 0.9)
+            for benchmark in benchmarks
+        ]
 
         start_time = time.perf_counter()
 
-        for benchmark in benchmarks:
-            if run_funcs and benchmark.case_id in run_funcs:
-                result = self.run_benchmark(
-                    benchmark.case_id, run_funcs[benchmark.case_id], run_id=run_id
+        if parallel and len(benchmarks) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(
+                    executor.map(_measure_benchmark, benchmarks, funcs, repeat(run_id))
                 )
-            else:
-                # Run with default mock function for testing
-                # Capture benchmark in local variable to avoid late binding issues
-                target_val = benchmark.target_value
-                result = self.run_benchmark(
-                    benchmark.case_id,
-                    lambda tv=target_val: tv * 0.9,  # type: ignore[misc]
-                    run_id=run_id,
-                )
-            results.append(result)
+        else:
+            results = [
+                _measure_benchmark(benchmark, func, run_id)
+                for benchmark, func in zip(benchmarks, funcs, strict=True)
+            ]
 
         duration_ms = (time.perf_counter() - start_time) * 1000
 
+        history = self._individual_results
+        for result in results:
+            history[result.case_id].append(result)
+
         run = BenchmarkRun(
             run_id=run_id,
-            timestamp=_timestamp(),
+            timestamp=time.time(),
             results=tuple(results),
             duration_ms=duration_ms,
         )
         self._runs.append(run)
         return run
 
+    def run_suite_values(
+        self,
+        values: dict[str, float],
+        category: BenchmarkCategory | None = None,
+    ) -> BenchmarkRun:
+        """Record a suite run from precomputed values without invoking callables.
+
+        Cases missing from ``values`` get the same mock value as ``run_suite``.
+        """
+        run_id = _generate_run_id()
+        timestamp = time.time()
+        start_time = time.perf_counter()
+
+        results = []
+        history = self._individual_results
+        for benchmark in self.list_benchmarks(category):
+            value = values.get(benchmark.case_id, benchmark.target_value * 0.9)
+            result = BenchmarkResult(
+                case_id=benchmark.case_id,
+                run_id=run_id,
+                value=value,
+                passed=_PASS_CHECKS[benchmark.metric_type](
+                    value, benchmark.target_value
+                ),
+                duration_ms=0.0,
+                timestamp=timestamp,
+            )
+            results.append(result)
+            history[benchmark.case_id].append(result)
+
+        run = BenchmarkRun(
+            run_id=run_id,
+            timestamp=timestamp,
+            results=tuple(results),
+            duration_ms=(time.perf_counter() - start_time) * 1000,
+        )
+        self._runs.append(run)
+        return run
+
     def get_run(self, run_id: str) -> BenchmarkRun | None:
         """Get a specific benchmark run."""
         for run in self._runs:
@@ -405,7 +504,7 @@ class BenchmarkRunner:
         """Get historical results for a benchmark case (oldest first)."""
         # First check individual results - return in chronological order
         if case_id in self._individual_results:
-            return self._individual_results[case_id][-limit:]
+            return list(self._individual_results[case_id])[-limit:]
 
         # Fall back to runs - need to reverse to get chronological order
         history = []
@@ -421,26 +520,29 @@ class BenchmarkRunner:
         if len(history) < 3:
             return None
 
-        # Simple linear regression
-        values = [(r.timestamp, r.value) for r in history]
+        # Simple linear regression over x = 0..n-1. The x moments have closed
+        # forms, so only y needs a mean pass plus one fused pass for the
+        # centered cross and square sums.
+        values = array("d", [r.value for r in history])
         n = len(values)
-        x_mean = sum(i for i, _ in enumerate(values)) / n
-        y_mean = sum(v for _, v in values) / n
+        x_mean = (n - 1) / 2
+        y_mean = sum(values) / n
 
-        numerator = sum((i - x_mean) * (v - y_mean) for i, (_, v) in enumerate(values))
-        denominator = sum((i - x_mean) ** 2 for i in range(n))
+        numerator = 0.0
+        ss_tot = 0.0
+        for i, v in enumerate(values):
+            dy = v - y_mean
+            numerator += (i - x_mean) * dy
+            ss_tot += dy * dy
+        denominator = n * (n * n - 1) / 12
 
         if denominator == 0:
             slope = 0.0
         else:
             slope = numerator / denominator
 
-        # Calculate R-squared
-        ss_res = sum(
-            (v - (y_mean + slope * (i - x_mean))) ** 2
-            for i, (_, v) in enumerate(values)
-        )
-        ss_tot = sum((v - y_mean) ** 2 for _, v in values)
+        # Calculate R-squared; the residual sum follows from the fit
+        ss_res = max(ss_tot - slope * numerator, 0.0)
         r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0.0
 
         benchmark = self._benchmarks.get(case_id)
@@ -466,6 +568,7 @@ class BenchmarkRunner:
             r_squared=r_squared,
             alert_threshold=alert_threshold,
             is_regressing=is_regressing,
+            timestamps=array("d", [r.timestamp for r in history]),
         )
 
     def get_regression_alerts(self) -> list[TrendLine]:
@@ -484,7 +587,7 @@ class BenchmarkRunner:
 
         data = {
             "run_id": run.run_id,
-            "timestamp": run.timestamp,
+            "timestamp": _format_timestamp(run.timestamp),
             "duration_ms": run.duration_ms,
             "git_commit": run.git_commit,
             "branch": run.branch,
@@ -494,7 +597,7 @@ class BenchmarkRunner:
                     "value": r.value,
                     "passed": r.passed,
                     "duration_ms": r.duration_ms,
-                    "timestamp": r.timestamp,
+                    "timestamp": _format_timestamp(r.timestamp),
                     "error": r.error,
                 }
                 for r in run.results
@@ -514,34 +617,51 @@ class BenchmarkRunner:
         if run is None:
             return {"error": "No benchmark runs found"}
 
-        passed = sum(1 for r in run.results if r.passed)
-        failed = len(run.results) - passed
-        pass_rate = passed / len(run.results) if run.results else 0.0
-
-        by_category: dict[str, list[BenchmarkResult]] = {}
+        # Single pass accumulating totals, per-category counts and failures
+        passed = 0
+        category_counts: dict[str, list[int]] = {}  # category -> [total, passed]
+        failed_tests: list[dict[str, Any]] = []
+        benchmarks = self._benchmarks
         for result in run.results:
-            benchmark = self._benchmarks.get(result.case_id)
+            benchmark = benchmarks.get(result.case_id)
             if benchmark:
-                cat = benchmark.category.value
-                by_category.setdefault(cat, []).append(result)
-
-        category_summary = {}
-        for cat, results in by_category.items():
-            cat_passed = sum(1 for r in results if r.passed)
-            category_summary[cat] = {
-                "total": len(results),
+                counts = category_counts.setdefault(benchmark.category.value, [0, 0])
+                counts[0] += 1
+            if result.passed:
+                passed += 1
+                if benchmark:
+                    counts[1] += 1
+            else:
+                failed_tests.append(
+                    {
+                        "case_id": result.case_id,
+                        "value": result.value,
+                        "target": benchmark.target_value if benchmark else None,
+                        "error": result.error,
+                    }
+                )
+
+        total = len(run.results)
+        failed = total - passed
+        pass_rate = passed / total if total else 0.0
+
+        category_summary = {
+            cat: {
+                "total": cat_total,
                 "passed": cat_passed,
-                "failed": len(results) - cat_passed,
-                "pass_rate": cat_passed / len(results) if results else 0.0,
+                "failed": cat_total - cat_passed,
+                "pass_rate": cat_passed / cat_total,
             }
+            for cat, (cat_total, cat_passed) in category_counts.items()
+        }
 
         regressions = self.get_regression_alerts()
 
         return {
             "run_id": run.run_id,
-            "timestamp": run.timestamp,
+            "timestamp": _format_timestamp(run.timestamp),
             "summary": {
-                "total": len(run.results),
+                "total": total,
                 "passed": passed,
                 "failed": failed,
                 "pass_rate": pass_rate,
@@ -556,20 +676,7 @@ class BenchmarkRunner:
                 }
                 for t in regressions
             ],
-            "failed_tests": [
-                {
-                    "case_id": r.case_id,
-                    "value": r.value,
-                    "target": (
-                        self._benchmarks[r.case_id].target_value
-                        if r.case_id in self._benchmarks
-                        else None
-                    ),
-                    "error": r.error,
-                }
-                for r in run.results
-                if not r.passed
-            ],
+            "failed_tests": failed_tests,
         }
 
 
@@ -590,7 +697,7 @@ class ReleaseGate(Enum):
     COST = "cost"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GateRequirement:
     """Requirement for a release gate."""
 
@@ -601,7 +708,7 @@ class GateRequirement:
     is_mandatory: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GateCheckResult:
     """Result of a gate check."""
 
@@ -613,7 +720,7 @@ class GateCheckResult:
     details: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReleaseGateStatus:
     """Overall status of a release gate."""
 
@@ -779,14 +886,23 @@ DEFAULT_GATE_REQUIREMENTS: tuple[GateRequirement, ...] = (
     ),
 )
 
+REQ_BY_ID: dict[str, GateRequirement] = {
+    r.requirement_id: r for r in DEFAULT_GATE_REQUIREMENTS
+}
+REQS_BY_GATE: dict[ReleaseGate, tuple[GateRequirement, ...]] = {
+    gate: tuple(r for r in DEFAULT_GATE_REQUIREMENTS if r.gate == gate)
+    for gate in ReleaseGate
+}
+
 
 class ReleaseGateVerifier:
     """G10.2: Release gate verification system."""
 
     def __init__(self) -> None:
-        self._requirements: dict[str, GateRequirement] = {
-            r.requirement_id: r for r in DEFAULT_GATE_REQUIREMENTS
-        }
+        self._requirements: dict[str, GateRequirement] = dict(REQ_BY_ID)
+        self._requirements_by_gate: dict[ReleaseGate, tuple[GateRequirement, ...]] = (
+            dict(REQS_BY_GATE)
+        )
         self._check_functions: dict[
             str, Callable[[], tuple[bool, str, dict[str, Any]]]
         ] = {
@@ -873,9 +989,23 @@ class ReleaseGateVerifier:
             "check_budget_controls": lambda: (True, "Budget controls active", {}),
             "check_cost_tracking": lambda: (True, "Cost tracking functional", {}),
         }
+        # Memoized verify_all_gates() result; None marks it dirty
+        self._gate_cache: dict[ReleaseGate, ReleaseGateStatus] | None = None
+
+    def register_check_function(
+        self, name: str, check_func: Callable[[], tuple[bool, str, dict[str, Any]]]
+    ) -> None:
+        """Register or replace a check function and drop cached gate results."""
+        self._check_functions[name] = check_func
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Force the next verify_all_gates() call to re-run every check."""
+        self._gate_cache = None
 
     def run_gate_check(self, requirement_id: str) -> GateCheckResult:
         """Run a single gate check."""
+        self._gate_cache = None
         req = self._requirements.get(requirement_id)
         if req is None:
             return GateCheckResult(
@@ -917,23 +1047,17 @@ class ReleaseGateVerifier:
 
     def verify_gate(self, gate: ReleaseGate) -> ReleaseGateStatus:
         """Verify all requirements for a release gate."""
-        checks: list[GateCheckResult] = []
-
-        for req in self._requirements.values():
-            if req.gate == gate:
-                result = self.run_gate_check(req.requirement_id)
-                checks.append(result)
+        requirements = self._requirements_by_gate.get(gate, ())
+        checks = [self.run_gate_check(req.requirement_id) for req in requirements]
 
         passed_count = sum(1 for c in checks if c.passed)
-        failed_count = sum(1 for c in checks if not c.passed)
+        failed_count = len(checks) - passed_count
 
         # Gate passes if all mandatory checks pass
         gate_passed = all(
             c.passed
-            for c in checks
-            if self._requirements.get(
-                c.requirement_id, GateRequirement("", gate, "", "")
-            ).is_mandatory
+            for req, c in zip(requirements, checks, strict=True)
+            if req.is_mandatory
         )
 
         return ReleaseGateStatus(
@@ -946,8 +1070,11 @@ class ReleaseGateVerifier:
         )
 
     def verify_all_gates(self) -> dict[ReleaseGate, ReleaseGateStatus]:
-        """Verify all release gates."""
-        return {gate: self.verify_gate(gate) for gate in ReleaseGate}
+        """Verify all release gates, reusing the last result until invalidated."""
+        if self._gate_cache is None:
+            gate_results = {gate: self.verify_gate(gate) for gate in ReleaseGate}
+            self._gate_cache = gate_results
+        return dict(self._gate_cache)
 
     def generate_release_report(self) -> dict[str, Any]:
         """Generate comprehensive release readiness report."""
@@ -993,7 +1120,7 @@ class ReleaseGateVerifier:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BetaPersona:
     """Beta test user persona."""
 
@@ -1005,7 +1132,7 @@ class BetaPersona:
     content_preferences: tuple[str, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BetaFeedback:
     """Structured feedback from beta testers."""
 
@@ -1015,12 +1142,12 @@ class BetaFeedback:
     rating: int  # 1-5
     description: str
     context: dict[str, str]
-    submitted_at: str
+    submitted_at: float  # Epoch seconds
     priority: str = "normal"  # "low", "normal", "high", "critical"
     status: str = "open"  # "open", "triaged", "in_progress", "resolved", "closed"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BetaIssue:
     """Tracked beta issue."""
 
@@ -1031,8 +1158,8 @@ class BetaIssue:
     category: str
     priority: str
     status: str
-    created_at: str
-    resolved_at: str | None = None
+    created_at: float  # Epoch seconds
+    resolved_at: float | None = None
 
 
 DEFAULT_BETA_PERSONAS: tuple[BetaPersona, ...] = (
@@ -1079,7 +1206,12 @@ class BetaProgram:
             p.persona_id: p for p in DEFAULT_BETA_PERSONAS
         }
         self._feedback: list[BetaFeedback] = []
+        # Positions into _feedback, so triaged replacements stay visible
+        self._feedback_positions: dict[str, int] = {}
+        self._feedback_by_category: defaultdict[str, list[int]] = defaultdict(list)
         self._issues: list[BetaIssue] = []
+        self._issue_positions: dict[str, int] = {}
+        self._issues_by_priority: defaultdict[str, list[int]] = defaultdict(list)
         self._counter = 0
 
     def get_persona(self, persona_id: str) -> BetaPersona | None:
@@ -1108,10 +1240,13 @@ class BetaProgram:
             rating=rating,
             description=description,
             context=context or {},
-            submitted_at=_timestamp(),
+            submitted_at=time.time(),
             priority=priority,
         )
+        position = len(self._feedback)
         self._feedback.append(feedback)
+        self._feedback_positions[feedback.feedback_id] = position
+        self._feedback_by_category[category].append(position)
         return feedback
 
     def get_feedback(
@@ -1123,7 +1258,10 @@ class BetaProgram:
         """Get feedback with optional filtering."""
         results = self._feedback
         if category:
-            results = [f for f in results if f.category == category]
+            feedback = self._feedback
+            results = [
+                feedback[i] for i in self._feedback_by_category.get(category, ())
+            ]
         if status:
             results = [f for f in results if f.status == status]
         if persona_id:
@@ -1134,12 +1272,12 @@ class BetaProgram:
         self, feedback_id: str, issue_id: str | None = None
     ) -> BetaFeedback | None:
         """Triage feedback and optionally link to issue."""
-        for i, feedback in enumerate(self._feedback):
-            if feedback.feedback_id == feedback_id:
-                updated = replace(feedback, status="triaged")
-                self._feedback[i] = updated
-                return updated
-        return None
+        position = self._feedback_positions.get(feedback_id)
+        if position is None:
+            return None
+        updated = replace(self._feedback[position], status="triaged")
+        self._feedback[position] = updated
+        return updated
 
     def create_issue(
         self,
@@ -1159,26 +1297,32 @@ class BetaProgram:
             category=category,
             priority=priority,
             status="open",
-            created_at=_timestamp(),
+            created_at=time.time(),
         )
+        position = len(self._issues)
         self._issues.append(issue)
+        self._issue_positions[issue.issue_id] = position
+        self._issues_by_priority[priority].append(position)
         return issue
 
     def resolve_issue(self, issue_id: str) -> BetaIssue | None:
         """Mark a beta issue as resolved."""
-        for i, issue in enumerate(self._issues):
-            if issue.issue_id == issue_id:
-                updated = replace(issue, status="resolved", resolved_at=_timestamp())
-                self._issues[i] = updated
-                return updated
-        return None
+        position = self._issue_positions.get(issue_id)
+        if position is None:
+            return None
+        updated = replace(
+            self._issues[position], status="resolved", resolved_at=time.time()
+        )
+        self._issues[position] = updated
+        return updated
 
     def get_critical_issues(self) -> list[BetaIssue]:
         """Get all critical open issues."""
+        issues = self._issues
         return [
-            i
-            for i in self._issues
-            if i.priority == "critical" and i.status != "resolved"
+            issues[i]
+            for i in self._issues_by_priority.get("critical", ())
+            if issues[i].status != "resolved"
         ]
 
     def generate_feedback_report(self) -> dict[str, Any]:
@@ -1190,18 +1334,17 @@ class BetaProgram:
             else 0.0
         )
 
-        by_category: dict[str, list[BetaFeedback]] = {}
-        for f in self._feedback:
-            by_category.setdefault(f.category, []).append(f)
-
+        feedback = self._feedback
         category_stats = {
             cat: {
-                "count": len(items),
+                "count": len(positions),
                 "avg_rating": (
-                    sum(f.rating for f in items) / len(items) if items else 0.0
+                    sum(feedback[i].rating for i in positions) / len(positions)
+                    if positions
+                    else 0.0
                 ),
             }
-            for cat, items in by_category.items()
+            for cat, positions in self._feedback_by_category.items()
         }
 
         critical_issues = self.get_critical_issues()
@@ -1262,7 +1405,7 @@ class BetaProgram:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DocumentationStatus:
     """Status of documentation."""
 
@@ -1273,7 +1416,7 @@ class DocumentationStatus:
     word_count: int | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReleaseVersion:
     """Release version information."""
 
@@ -1294,25 +1437,31 @@ class ReleaseReadinessChecker:
     def __init__(self, project_root: Path | None = None) -> None:
         self._project_root = project_root or Path(".")
         self._version: ReleaseVersion | None = None
+        # doc name -> ((mtime_ns, size), (word_count, is_complete))
+        self._doc_cache: dict[str, tuple[tuple[int, int], tuple[int, bool]]] = {}
 
     def check_documentation(self) -> list[DocumentationStatus]:
         """Check status of all required documentation."""
+        # One directory listing replaces an exists() probe per document
+        try:
+            with os.scandir(self._project_root) as it:
+                entries = {e.name: e for e in it if e.is_file()}
+        except OSError:
+            entries = {}
+
         statuses = []
 
         for doc_name in self.REQUIRED_DOCS:
-            doc_path = self._project_root / doc_name
-            exists = doc_path.exists()
+            entry = entries.get(doc_name)
+            exists = entry is not None
             last_updated = None
             word_count = None
             is_complete = False
 
-            if exists:
-                stat = doc_path.stat()
+            if entry is not None:
+                stat = entry.stat()
                 last_updated = datetime.fromtimestamp(stat.st_mtime, UTC).isoformat()
-                content = doc_path.read_text()
-                word_count = len(content.split())
-                # Simple completeness check - has content and sections
-                is_complete = len(content) > 500 and "#" in content
+                word_count, is_complete = self._analyze_doc(doc_name, stat)
 
             statuses.append(
                 DocumentationStatus(
@@ -1326,6 +1475,20 @@ class ReleaseReadinessChecker:
 
         return statuses
 
+    def _analyze_doc(self, doc_name: str, stat: os.stat_result) -> tuple[int, bool]:
+        """Word count and completeness for a doc, re-read only when it changes."""
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._doc_cache.get(doc_name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        content = (self._project_root / doc_name).read_text()
+        word_count = len(content.split())
+        # Simple completeness check - has content and sections
+        is_complete = len(content) > 500 and "#" in content
+        self._doc_cache[doc_name] = (key, (word_count, is_complete))
+        return word_count, is_complete
+
     def check_all_docs_complete(self) -> bool:
         """Check if all required documentation is complete."""
         statuses = self.check_documentation()
@@ -1456,7 +1619,7 @@ class ReleaseReadinessChecker:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Phase10Metrics:
     """Aggregated metrics for Phase 10 done-criteria validation."""
 
@@ -1476,8 +1639,26 @@ class ReleaseEngine:
         self.beta = BetaProgram()
         self.readiness = ReleaseReadinessChecker(project_root)
 
-    def evaluate_phase10_done_criteria(self) -> Phase10Metrics:
-        """Evaluate Phase 10 done criteria."""
+    def evaluate_phase10_done_criteria(self, *, fast: bool = False) -> Phase10Metrics:
+        """Evaluate Phase 10 done criteria.
+
+        With ``fast=True`` the cheap blockers (critical beta issues, incomplete
+        docs) are checked first; if either trips, gates and benchmarks are not
+        evaluated and are reported as failing.
+        """
+        # Check beta issues and docs first; they are the cheapest blockers
+        critical_issues = self.beta.get_critical_issues()
+        docs_complete = self.readiness.check_all_docs_complete()
+
+        if fast and (critical_issues or not docs_complete):
+            return Phase10Metrics(
+                all_gates_pass=False,
+                benchmarks_pass_rate=0.0,
+                docs_complete=docs_complete,
+                critical_beta_issues=len(critical_issues),
+                release_ready=False,
+            )
+
         # Run gate verification
         gate_results = self.gates.verify_all_gates()
         all_gates_pass = all(s.passed for s in gate_results.values())
@@ -1501,12 +1682,6 @@ class ReleaseEngine:
                         passed += 1
             benchmarks_pass_rate = passed / total if total > 0 else 0.0
 
-        # Check docs
-        docs_complete = self.readiness.check_all_docs_complete()
-
-        # Check beta issues
-        critical_issues = self.beta.get_critical_issues()
-
         # Overall release readiness
         release_ready = (
             all_gates_pass
@@ -1525,6 +1700,8 @@ class ReleaseEngine:
 
 
 __all__ = [
+    "BENCHMARKS_BY_CATEGORY",
+    "BENCHMARK_BY_ID",
     "BenchmarkCase",
     "BenchmarkCategory",
     "BenchmarkMetricType",
@@ -1536,12 +1713,16 @@ __all__ = [
     "BetaPersona",
     "BetaProgram",
     "DEFAULT_BENCHMARKS",
+    "DEFAULT_BENCHMARK_CATEGORIES",
+    "DEFAULT_BENCHMARK_IDS",
     "DEFAULT_BETA_PERSONAS",
     "DEFAULT_GATE_REQUIREMENTS",
     "DocumentationStatus",
     "GateCheckResult",
     "GateRequirement",
     "Phase10Metrics",
+    "REQS_BY_GATE",
+    "REQ_BY_ID",
     "ReleaseEngine",
     "ReleaseGate",
     "ReleaseGateStatus",
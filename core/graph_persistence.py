@@ -327,31 +327,38 @@ class SQLiteGraphPersistence(GraphPersistence):
         """Get database connection."""
         return sqlite3.connect(self.db_path)
 
-    async def save_node(self, node: GraphNode) -> bool:
-        """Save or update a node."""
-        import asyncio
+    def save_node_sync(self, node: GraphNode) -> bool:
+        """Save or update a node without going through an event loop.
 
-        def _save():
-            conn = self._get_connection()
-            cursor = conn.cursor()
+        For synchronous callers such as CLI scripts, which would otherwise
+        need to spin up a loop just to await ``save_node``.
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
 
-            data = node.to_dict()
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO nodes 
-                (node_id, label, branch_id, scene_id, x, y, importance, node_type, metadata, 
-                 created_at, updated_at)
-                VALUES (:node_id, :label, :branch_id, :scene_id, :x, :y, :importance, 
-                        :node_type, :metadata, :created_at, :updated_at)
-            """,
-                data,
-            )
+        data = node.to_dict()
+        cursor.execute(
+            """
+            INSERT OR REPLACE INTO nodes 
+            (node_id, label, branch_id, scene_id, x, y, importance, node_type,
+             metadata, created_at, updated_at)
+            VALUES (:node_id, :label, :branch_id, :scene_id, :x, :y, :importance, 
+                    :node_type, :metadata, :created_at, :updated_at)
+        """,
+            data,
+        )
 
-            conn.commit()
-            conn.close()
-            return True
+        conn.commit()
+        conn.close()
+        return True
 
-        return await asyncio.get_event_loop().run_in_executor(None, _save)
+    async def save_node(self, node: GraphNode) -> bool:
+        """Save or update a node."""
+        import asyncio
+
+        return await asyncio.get_event_loop().run_in_executor(
+            None, self.save_node_sync, node
+        )
 
     async def get_node(self, node_id: str) -> GraphNode | None:
         """Get a node by ID."""
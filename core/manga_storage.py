@@ -10,13 +10,28 @@ from __future__ import annotations
 
 import json
 import sqlite3
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+_PAGE_COLUMN_COUNT = 7
+# Stay under SQLite's historical 999 bound-variable limit per statement.
+_PAGE_ROWS_PER_STATEMENT = 999 // _PAGE_COLUMN_COUNT
 
-@dataclass(frozen=True)
+
+def _insert_pages_sql(row_count: int) -> str:
+    """Build a multi-row INSERT for ``row_count`` manga page rows."""
+    row_placeholders = "(" + ", ".join("?" * _PAGE_COLUMN_COUNT) + ")"
+    return (
+        "INSERT INTO manga_pages "
+        "(volume_id, page_number, format_name, width, height, content_hash, ocr_text) "
+        "VALUES " + ", ".join([row_placeholders] * row_count)
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class MangaPage:
     """A single page in a manga volume."""
 
@@ -60,6 +75,7 @@ class MangaVolume:
     source_hash: str
     pages: tuple[MangaPage, ...] = ()
     graph_node_id: str | None = None
+    listing_fingerprint: str = ""
     created_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
     updated_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
 
@@ -72,6 +88,7 @@ class MangaVolume:
             "source_hash": self.source_hash,
             "pages": [p.to_dict() for p in self.pages],
             "graph_node_id": self.graph_node_id,
+            "listing_fingerprint": self.listing_fingerprint,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
         }
@@ -87,6 +104,7 @@ class MangaVolume:
             source_hash=data["source_hash"],
             pages=pages,
             graph_node_id=data.get("graph_node_id"),
+            listing_fingerprint=data.get("listing_fingerprint", ""),
             created_at=data["created_at"],
             updated_at=data["updated_at"],
         )
@@ -115,11 +133,21 @@ class MangaStorage:
                 page_count INTEGER NOT NULL,
                 source_hash TEXT NOT NULL,
                 graph_node_id TEXT,
+                listing_fingerprint TEXT DEFAULT '',
                 created_at TEXT NOT NULL,
                 updated_at TEXT NOT NULL
             )
         """)
 
+        # Migration: Add listing_fingerprint column for existing databases
+        try:
+            cursor.execute("SELECT listing_fingerprint FROM manga_volumes LIMIT 1")
+        except sqlite3.OperationalError:
+            cursor.execute(
+                "ALTER TABLE manga_volumes "
+                "ADD COLUMN listing_fingerprint TEXT DEFAULT ''"
+            )
+
         # Pages table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS manga_pages (
@@ -141,6 +169,10 @@ class MangaStorage:
             CREATE INDEX IF NOT EXISTS idx_manga_pages_volume 
             ON manga_pages(volume_id)
         """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_manga_volumes_listing_fingerprint
+            ON manga_volumes(listing_fingerprint)
+        """)
 
         conn.commit()
         conn.close()
@@ -151,6 +183,22 @@ class MangaStorage:
 
     def save_volume(self, volume: MangaVolume) -> bool:
         """Save or update a manga volume."""
+        return self.save_volume_streaming(volume, volume.pages)
+
+    def save_volume_streaming(
+        self,
+        volume: MangaVolume,
+        pages: Iterable[MangaPage],
+        chunk_size: int = _PAGE_ROWS_PER_STATEMENT,
+    ) -> bool:
+        """Save a volume header and insert its pages in bounded chunks.
+
+        ``pages`` may be a lazy iterator; each chunk of up to ``chunk_size``
+        rows (capped by SQLite's bound-variable limit) is written by a single
+        multi-row INSERT, so peak memory does not grow with page count.
+        ``volume.pages`` is ignored in favour of ``pages``.
+        """
+        rows_per_statement = max(1, min(chunk_size, _PAGE_ROWS_PER_STATEMENT))
         conn = self._get_connection()
         cursor = conn.cursor()
 
@@ -158,8 +206,9 @@ class MangaStorage:
             # Insert or replace volume
             cursor.execute("""
                 INSERT OR REPLACE INTO manga_volumes 
-                (volume_id, title, source_path, page_count, source_hash, graph_node_id, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                (volume_id, title, source_path, page_count, source_hash, graph_node_id,
+                 listing_fingerprint, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 volume.volume_id,
                 volume.title,
@@ -167,6 +216,7 @@ class MangaStorage:
                 volume.page_count,
                 volume.source_hash,
                 volume.graph_node_id,
+                volume.listing_fingerprint,
                 volume.created_at,
                 volume.updated_at,
             ))
@@ -174,13 +224,13 @@ class MangaStorage:
             # Delete existing pages for this volume
             cursor.execute("DELETE FROM manga_pages WHERE volume_id = ?", (volume.volume_id,))
 
-            # Insert pages
-            for page in volume.pages:
-                cursor.execute("""
-                    INSERT INTO manga_pages 
-                    (volume_id, page_number, format_name, width, height, content_hash, ocr_text)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
+            # Insert pages chunk by chunk through one pre-sized flat buffer
+            full_chunk_sql = _insert_pages_sql(rows_per_statement)
+            params: list[Any] = [None] * (rows_per_statement * _PAGE_COLUMN_COUNT)
+            filled = 0
+            for page in pages:
+                offset = filled * _PAGE_COLUMN_COUNT
+                params[offset : offset + _PAGE_COLUMN_COUNT] = (
                     volume.volume_id,
                     page.page_number,
                     page.format_name,
@@ -188,7 +238,16 @@ class MangaStorage:
                     page.height,
                     page.content_hash,
                     page.ocr_text,
-                ))
+                )
+                filled += 1
+                if filled == rows_per_statement:
+                    cursor.execute(full_chunk_sql, params)
+                    filled = 0
+            if filled:
+                cursor.execute(
+                    _insert_pages_sql(filled),
+                    params[: filled * _PAGE_COLUMN_COUNT],
+                )
 
             conn.commit()
             return True
@@ -208,7 +267,7 @@ class MangaStorage:
             # Get volume
             cursor.execute("""
                 SELECT volume_id, title, source_path, page_count, source_hash, 
-                       graph_node_id, created_at, updated_at
+                       graph_node_id, created_at, updated_at, listing_fingerprint
                 FROM manga_volumes WHERE volume_id = ?
             """, (volume_id,))
 
@@ -242,6 +301,7 @@ class MangaStorage:
                 source_hash=row[4],
                 pages=pages,
                 graph_node_id=row[5],
+                listing_fingerprint=row[8] or "",
                 created_at=row[6],
                 updated_at=row[7],
             )
@@ -320,7 +380,7 @@ class MangaStorage:
         try:
             cursor.execute("""
                 SELECT volume_id, title, source_path, page_count, source_hash, 
-                       graph_node_id, created_at, updated_at
+                       graph_node_id, created_at, updated_at, listing_fingerprint
                 FROM manga_volumes
                 ORDER BY created_at DESC
                 LIMIT ? OFFSET ?
@@ -335,6 +395,7 @@ class MangaStorage:
                     source_hash=row[4],
                     pages=(),  # Don't load pages for listing
                     graph_node_id=row[5],
+                    listing_fingerprint=row[8] or "",
                     created_at=row[6],
                     updated_at=row[7],
                 )
@@ -376,6 +437,32 @@ class MangaStorage:
         finally:
             conn.close()
 
+    def get_volume_by_listing_fingerprint(
+        self, listing_fingerprint: str
+    ) -> MangaVolume | None:
+        """Get a volume by its folder listing fingerprint.
+
+        The fingerprint is cheap to compute before ingestion, so importers can
+        skip re-importing an unchanged folder without hashing page content.
+        """
+        if not listing_fingerprint:
+            return None
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("""
+                SELECT volume_id FROM manga_volumes WHERE listing_fingerprint = ?
+            """, (listing_fingerprint,))
+
+            row = cursor.fetchone()
+            if row:
+                return self.get_volume(row[0])
+            return None
+        finally:
+            conn.close()
+
 
 # Global instance
 _manga_storage: MangaStorage | None = None
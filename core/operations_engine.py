@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import hashlib
+import importlib
 import re
-import uuid
+import secrets
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime, timedelta
 from enum import Enum
-from typing import Any
+from types import MappingProxyType
+from typing import Any, cast
 
 
 def _timestamp() -> str:
@@ -16,11 +23,33 @@ def _timestamp() -> str:
 
 
 def _generate_id() -> str:
-    return uuid.uuid4().hex[:16]
+    return secrets.token_hex(8)
 
 
-def _hash_content(content: str) -> str:
-    return hashlib.sha256(content.encode()).hexdigest()[:16]
+def _hash_content(content: str, algorithm: str = "sha256") -> str:
+    if algorithm == "blake3":
+        blake3_module = importlib.import_module("blake3")
+        return cast(str, blake3_module.blake3(content.encode()).hexdigest()[:16])
+    return hashlib.new(algorithm, content.encode()).hexdigest()[:16]
+
+
+_correlation_id: ContextVar[str | None] = ContextVar(
+    "loom_correlation_id", default=None
+)
+
+
+@contextmanager
+def correlation_scope(correlation_id: str | None = None) -> Iterator[str]:
+    """Bind a correlation ID to logs emitted within the block.
+
+    Explicit request/job/branch IDs passed to ``log`` still take precedence.
+    """
+    scoped_id = correlation_id or _generate_id()
+    token = _correlation_id.set(scoped_id)
+    try:
+        yield scoped_id
+    finally:
+        _correlation_id.reset(token)
 
 
 def _clamp(value: float, min_val: float = 0.0, max_val: float = 1.0) -> float:
@@ -48,7 +77,7 @@ class Component(Enum):
     FRONTEND = "frontend"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StructuredLogEntry:
     """Structured log entry with correlation IDs."""
 
@@ -66,7 +95,7 @@ class StructuredLogEntry:
     parent_span_id: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TraceSpan:
     """Distributed trace span."""
 
@@ -81,7 +110,7 @@ class TraceSpan:
     attributes: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SLODefinition:
     """Service Level Objective definition."""
 
@@ -93,7 +122,7 @@ class SLODefinition:
     metric_type: str  # "latency", "availability", "success_rate"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SLOMeasurement:
     """SLO measurement result."""
 
@@ -142,22 +171,36 @@ DEFAULT_SLOS: tuple[SLODefinition, ...] = (
 )
 
 
+_DEFAULT_SLOS_BY_NAME: Mapping[str, SLODefinition] = MappingProxyType(
+    {slo.name: slo for slo in DEFAULT_SLOS}
+)
+
+
 class ObservabilityManager:
     """G9.1: Structured logging, tracing, and SLO monitoring."""
 
-    def __init__(self) -> None:
+    def __init__(self, *, span_history: int = 65_536) -> None:
         self._logs: list[StructuredLogEntry] = []
-        self._spans: list[TraceSpan] = []
+        # Positions into _logs, keyed by field name then field value. An index
+        # is only built once query_logs filters on that field.
+        self._log_indexes: dict[str, dict[Any, list[int]]] = {}
+        # Completed spans, oldest dropped once span_history is reached.
+        self._spans: deque[TraceSpan] = deque(maxlen=span_history)
         self._active_spans: dict[str, TraceSpan] = {}
-        self._slo_definitions: dict[str, SLODefinition] = {
-            slo.name: slo for slo in DEFAULT_SLOS
-        }
+        self._slo_definitions = _DEFAULT_SLOS_BY_NAME
         self._slo_measurements: dict[str, list[SLOMeasurement]] = {
             slo.name: [] for slo in DEFAULT_SLOS
         }
-        self._latency_samples: dict[str, list[tuple[str, float]]] = {
+        # Samples in arrival order (for window eviction) alongside the same
+        # values kept sorted, so percentiles are an index lookup.
+        self._latency_samples: dict[str, deque[tuple[str, float]]] = {
+            slo.name: deque() for slo in DEFAULT_SLOS
+        }
+        self._sorted_latencies: dict[str, list[float]] = {
             slo.name: [] for slo in DEFAULT_SLOS
         }
+        # Bumped whenever state read by the Phase 9 done criteria changes.
+        self._version = 0
 
     def log(
         self,
@@ -172,7 +215,9 @@ class ObservabilityManager:
     ) -> StructuredLogEntry:
         """Emit a structured log entry."""
         # Generate correlation ID from available IDs
-        correlation_id = request_id or job_id or branch_id or _generate_id()
+        correlation_id = (
+            request_id or job_id or branch_id or _correlation_id.get() or _generate_id()
+        )
 
         # Get current trace context if available
         trace_id = None
@@ -180,7 +225,7 @@ class ObservabilityManager:
         parent_span_id = None
         if self._active_spans:
             # Use most recent active span
-            latest_span = list(self._active_spans.values())[-1]
+            latest_span = next(reversed(self._active_spans.values()))
             trace_id = latest_span.trace_id
             span_id = latest_span.span_id
             parent_span_id = latest_span.parent_span_id
@@ -199,9 +244,22 @@ class ObservabilityManager:
             span_id=span_id,
             parent_span_id=parent_span_id,
         )
+        position = len(self._logs)
         self._logs.append(entry)
+        for field_name, index in self._log_indexes.items():
+            index.setdefault(getattr(entry, field_name), []).append(position)
         return entry
 
+    def _log_index(self, field_name: str) -> dict[Any, list[int]]:
+        """Return the log index for a field, building it on first use."""
+        index = self._log_indexes.get(field_name)
+        if index is None:
+            index = {}
+            for position, entry in enumerate(self._logs):
+                index.setdefault(getattr(entry, field_name), []).append(position)
+            self._log_indexes[field_name] = index
+        return index
+
     def start_span(
         self,
         operation: str,
@@ -210,16 +268,8 @@ class ObservabilityManager:
         attributes: dict[str, str] | None = None,
     ) -> TraceSpan:
         """Start a new trace span."""
-        trace_id = _generate_id() if parent_span_id is None else None
-        if parent_span_id and self._active_spans:
-            # Find parent to get trace_id
-            for span in self._active_spans.values():
-                if span.span_id == parent_span_id:
-                    trace_id = span.trace_id
-                    break
-
-        if trace_id is None:
-            trace_id = _generate_id()
+        parent = self._active_spans.get(parent_span_id) if parent_span_id else None
+        trace_id = parent.trace_id if parent is not None else _generate_id()
 
         span = TraceSpan(
             trace_id=trace_id,
@@ -247,6 +297,8 @@ class ObservabilityManager:
         """Record a latency sample for SLO tracking."""
         if slo_name in self._latency_samples:
             self._latency_samples[slo_name].append((_timestamp(), latency_ms))
+            insort(self._sorted_latencies[slo_name], latency_ms)
+            self._version += 1
             # Clean old samples outside window
             self._clean_old_samples(slo_name)
 
@@ -259,10 +311,12 @@ class ObservabilityManager:
         cutoff = datetime.now(UTC) - timedelta(minutes=slo.window_minutes)
         cutoff_str = cutoff.isoformat()
 
+        # Samples arrive in timestamp order, so expired ones sit at the front.
         samples = self._latency_samples[slo_name]
-        self._latency_samples[slo_name] = [
-            (ts, val) for ts, val in samples if ts >= cutoff_str
-        ]
+        sorted_values = self._sorted_latencies[slo_name]
+        while samples and samples[0][0] < cutoff_str:
+            _, val = samples.popleft()
+            del sorted_values[bisect_left(sorted_values, val)]
 
     def measure_slo(self, slo_name: str) -> SLOMeasurement | None:
         """Measure current SLO compliance."""
@@ -270,13 +324,13 @@ class ObservabilityManager:
         if slo is None:
             return None
 
-        samples = self._latency_samples.get(slo_name, [])
+        samples = self._latency_samples.get(slo_name)
         if not samples:
             return None
 
         if slo.metric_type == "latency":
             # Calculate P95 latency
-            sorted_values = sorted(val for _, val in samples)
+            sorted_values = self._sorted_latencies[slo_name]
             p95_index = int(len(sorted_values) * 0.95)
             measured = sorted_values[min(p95_index, len(sorted_values) - 1)]
         else:
@@ -322,6 +376,16 @@ class ObservabilityManager:
         """Query logs with filters."""
         results = self._logs
 
+        # Narrow to the smallest matching posting list before scanning.
+        postings: list[list[int]] = []
+        if level:
+            postings.append(self._log_index("level").get(level, []))
+        if correlation_id:
+            postings.append(self._log_index("correlation_id").get(correlation_id, []))
+        if postings:
+            logs = self._logs
+            results = [logs[i] for i in min(postings, key=len)]
+
         if level:
             results = [e for e in results if e.level == level]
         if component:
@@ -339,7 +403,7 @@ class ObservabilityManager:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Runbook:
     """Incident response runbook."""
 
@@ -354,7 +418,7 @@ class Runbook:
     last_updated: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IncidentScenario:
     """Representative incident scenario for replay."""
 
@@ -368,7 +432,7 @@ class IncidentScenario:
     expected_resolution: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Postmortem:
     """Incident postmortem document."""
 
@@ -468,16 +532,64 @@ INCIDENT_SCENARIOS: tuple[IncidentScenario, ...] = (
 )
 
 
+_SYMPTOM_SEPARATOR = "\0"
+
+
+def _index_runbook_symptoms(
+    runbooks: Iterable[Runbook],
+) -> tuple[str, tuple[int, ...], tuple[Runbook, ...]]:
+    """Join every runbook symptom into one string for single-pass matching.
+
+    Returns the joined text plus the start offset and owning runbook of each
+    symptom, in runbook order.
+    """
+    symptoms = [(rb, symptom) for rb in runbooks for symptom in rb.symptoms]
+    starts = []
+    offset = 0
+    for _, symptom in symptoms:
+        starts.append(offset)
+        offset += len(symptom) + len(_SYMPTOM_SEPARATOR)
+    return (
+        _SYMPTOM_SEPARATOR.join(symptom for _, symptom in symptoms),
+        tuple(starts),
+        tuple(rb for rb, _ in symptoms),
+    )
+
+
+# Default tables are immutable, so every manager shares them by reference.
+_DEFAULT_RUNBOOKS_BY_ID: Mapping[str, Runbook] = MappingProxyType(
+    {rb.runbook_id: rb for rb in DEFAULT_RUNBOOKS}
+)
+_DEFAULT_SYMPTOM_INDEX = _index_runbook_symptoms(DEFAULT_RUNBOOKS)
+_INCIDENT_SCENARIOS_BY_ID: Mapping[str, IncidentScenario] = MappingProxyType(
+    {s.scenario_id: s for s in INCIDENT_SCENARIOS}
+)
+_SCENARIO_PATTERNS: Mapping[str, tuple[re.Pattern[str], re.Pattern[str] | None]] = (
+    MappingProxyType(
+        {
+            s.scenario_id: (
+                re.compile(s.log_pattern, re.IGNORECASE),
+                re.compile(s.trace_pattern, re.IGNORECASE) if s.trace_pattern else None,
+            )
+            for s in INCIDENT_SCENARIOS
+        }
+    )
+)
+
+
 class IncidentManager:
     """G9.2: Incident readiness with runbooks, replay, and postmortems."""
 
     def __init__(self) -> None:
-        self._runbooks: dict[str, Runbook] = {
-            rb.runbook_id: rb for rb in DEFAULT_RUNBOOKS
-        }
-        self._scenarios: dict[str, IncidentScenario] = {
-            s.scenario_id: s for s in INCIDENT_SCENARIOS
-        }
+        self._runbooks = _DEFAULT_RUNBOOKS_BY_ID
+        self._scenarios = _INCIDENT_SCENARIOS_BY_ID
+        self._scenario_patterns = _SCENARIO_PATTERNS
+        # Every runbook symptom joined into one string, with the start offset
+        # and owning runbook of each symptom, so an input symptom is located
+        # with a single str.find.
+        self._symptom_text, self._symptom_starts, self._symptom_owners = (
+            _DEFAULT_SYMPTOM_INDEX
+        )
         self._postmortems: list[Postmortem] = []
         self._incident_counter = 0
 
@@ -494,13 +606,21 @@ class IncidentManager:
 
     def match_runbook(self, symptoms: list[str]) -> Runbook | None:
         """Match symptoms to a runbook."""
-        for runbook in self._runbooks.values():
-            matches = sum(
-                1 for s in symptoms if any(s in rs for rs in runbook.symptoms)
-            )
-            if matches > 0:
-                return runbook
-        return None
+        if not self._symptom_owners:
+            return None
+
+        # Symptoms are joined in runbook order, so the earliest hit of any
+        # input symptom identifies the first runbook that matches.
+        best: int | None = None
+        for symptom in symptoms:
+            if _SYMPTOM_SEPARATOR in symptom:
+                continue
+            position = self._symptom_text.find(symptom)
+            if position >= 0 and (best is None or position < best):
+                best = position
+        if best is None:
+            return None
+        return self._symptom_owners[bisect_right(self._symptom_starts, best) - 1]
 
     def get_scenario(self, scenario_id: str) -> IncidentScenario | None:
         """Get an incident scenario for replay."""
@@ -516,30 +636,32 @@ class IncidentManager:
     def replay_scenario(
         self,
         scenario_id: str,
-        logs: list[StructuredLogEntry],
-        spans: list[TraceSpan],
+        logs: Sequence[StructuredLogEntry],
+        spans: Sequence[TraceSpan],
     ) -> dict[str, Any]:
         """Replay an incident scenario against logs/traces."""
         scenario = self._scenarios.get(scenario_id)
         if scenario is None:
             return {"error": f"Scenario {scenario_id} not found"}
 
-        # Pattern matching
-        pattern = re.compile(scenario.log_pattern, re.IGNORECASE)
-        matched_logs = [log for log in logs if pattern.search(log.message)]
+        log_pattern, trace_pattern = self._scenario_patterns[scenario_id]
+        matched_logs = [log for log in logs if log_pattern.search(log.message)]
 
         matched_spans = []
-        if scenario.trace_pattern:
-            trace_pattern = re.compile(scenario.trace_pattern, re.IGNORECASE)
+        if trace_pattern is not None:
             matched_spans = [
                 span for span in spans if trace_pattern.search(span.operation)
             ]
 
-        detected_symptoms = set()
+        lowered_symptoms = [
+            (symptom, symptom.lower()) for symptom in scenario.expected_symptoms
+        ]
+        detected_symptoms: set[str] = set()
         for log in matched_logs:
-            for symptom in scenario.expected_symptoms:
-                if symptom.lower() in log.message.lower():
-                    detected_symptoms.add(symptom)
+            message = log.message.lower()
+            detected_symptoms.update(
+                symptom for symptom, needle in lowered_symptoms if needle in message
+            )
 
         return {
             "scenario_id": scenario_id,
@@ -613,7 +735,15 @@ class QueuePriority(Enum):
     BACKGROUND = 4
 
 
-@dataclass(frozen=True)
+_ALL_PRIORITIES_MASK = sum(1 << priority.value for priority in QueuePriority)
+
+# Kill-switch targets that block a priority class across every component.
+_PRIORITY_KILL_SWITCH_TARGETS: dict[str, QueuePriority] = {
+    "background": QueuePriority.BACKGROUND,
+}
+
+
+@dataclass(frozen=True, slots=True)
 class ResourceBudget:
     """Resource budget for a job or branch."""
 
@@ -626,7 +756,7 @@ class ResourceBudget:
     max_duration_seconds: int | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResourceUsage:
     """Current resource usage."""
 
@@ -638,7 +768,7 @@ class ResourceUsage:
     last_updated: str = field(default_factory=_timestamp)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KillSwitch:
     """Emergency kill switch configuration."""
 
@@ -652,6 +782,34 @@ class KillSwitch:
     reason: str | None = None
 
 
+DEFAULT_KILL_SWITCHES: tuple[KillSwitch, ...] = (
+    KillSwitch(
+        switch_id="kill-ingestion",
+        name="Kill All Ingestion",
+        description="Immediately stop all ingestion jobs",
+        target_component="ingestion",
+    ),
+    KillSwitch(
+        switch_id="kill-generation",
+        name="Kill All Generation",
+        description="Immediately stop all generation jobs",
+        target_component="generation",
+    ),
+    KillSwitch(
+        switch_id="kill-background",
+        name="Kill Background Jobs",
+        description="Stop all background priority jobs",
+        target_component="background",
+    ),
+    KillSwitch(
+        switch_id="kill-branch",
+        name="Kill Branch Operations",
+        description="Stop all branch operations",
+        target_component="branch",
+    ),
+)
+
+
 class CapacityManager:
     """G9.3: Capacity and cost management."""
 
@@ -659,32 +817,14 @@ class CapacityManager:
         self._budgets: dict[str, ResourceBudget] = {}
         self._usage: dict[str, ResourceUsage] = {}
         self._kill_switches: dict[str, KillSwitch] = {
-            "kill-ingestion": KillSwitch(
-                switch_id="kill-ingestion",
-                name="Kill All Ingestion",
-                description="Immediately stop all ingestion jobs",
-                target_component="ingestion",
-            ),
-            "kill-generation": KillSwitch(
-                switch_id="kill-generation",
-                name="Kill All Generation",
-                description="Immediately stop all generation jobs",
-                target_component="generation",
-            ),
-            "kill-background": KillSwitch(
-                switch_id="kill-background",
-                name="Kill Background Jobs",
-                description="Stop all background priority jobs",
-                target_component="background",
-            ),
-            "kill-branch": KillSwitch(
-                switch_id="kill-branch",
-                name="Kill Branch Operations",
-                description="Stop all branch operations",
-                target_component="branch",
-            ),
+            switch.switch_id: switch for switch in DEFAULT_KILL_SWITCHES
         }
+        # Priority bitmasks currently blocked by triggered switches: one per
+        # component plus one that applies to every component.
+        self._blocked_by_component: dict[str, int] = {}
+        self._blocked_for_all = 0
         self._counter = 0
+        self._version = 0  # see OperationsEngine._state_versions
 
     def create_budget(
         self,
@@ -709,6 +849,7 @@ class CapacityManager:
         )
         self._budgets[budget.budget_id] = budget
         self._usage[budget.budget_id] = ResourceUsage(budget_id=budget.budget_id)
+        self._version += 1
         return budget
 
     def record_usage(
@@ -784,6 +925,28 @@ class CapacityManager:
             },
         }
 
+    def check_all_budgets(self) -> dict[str, list[str]]:
+        """Sweep every budget and report the limits each one has exceeded.
+
+        Budgets within all of their limits are left out of the result.
+        """
+        exceeded_by_budget: dict[str, list[str]] = {}
+        for budget_id, budget in self._budgets.items():
+            usage = self._usage[budget_id]
+            exceeded = [
+                category
+                for category, limit, used in (
+                    ("tokens", budget.max_tokens, usage.tokens_used),
+                    ("images", budget.max_images, usage.images_generated),
+                    ("cost", budget.max_cost_usd, usage.cost_usd),
+                    ("duration", budget.max_duration_seconds, usage.duration_seconds),
+                )
+                if limit and used > limit
+            ]
+            if exceeded:
+                exceeded_by_budget[budget_id] = exceeded
+        return exceeded_by_budget
+
     def trigger_kill_switch(
         self,
         switch_id: str,
@@ -803,6 +966,7 @@ class CapacityManager:
             reason=reason,
         )
         self._kill_switches[switch_id] = triggered
+        self._refresh_blocked_priorities()
         return triggered
 
     def reset_kill_switch(self, switch_id: str, reset_by: str) -> KillSwitch | None:
@@ -819,26 +983,32 @@ class CapacityManager:
             reason=f"Reset by {reset_by}",
         )
         self._kill_switches[switch_id] = reset
+        self._refresh_blocked_priorities()
         return reset
 
+    def _refresh_blocked_priorities(self) -> None:
+        """Rebuild the blocked-priority masks from the triggered switches."""
+        self._version += 1
+        blocked_by_component: dict[str, int] = {}
+        blocked_for_all = 0
+        for switch in self._kill_switches.values():
+            if not switch.is_triggered:
+                continue
+            blocked_by_component[switch.target_component] = _ALL_PRIORITIES_MASK
+            priority = _PRIORITY_KILL_SWITCH_TARGETS.get(switch.target_component)
+            if priority is not None:
+                blocked_for_all |= 1 << priority.value
+        self._blocked_by_component = blocked_by_component
+        self._blocked_for_all = blocked_for_all
+
     def get_active_kill_switches(self) -> list[KillSwitch]:
         """Get all triggered kill switches."""
         return [s for s in self._kill_switches.values() if s.is_triggered]
 
     def is_operation_allowed(self, component: str, priority: QueuePriority) -> bool:
         """Check if an operation is allowed given current kill switches."""
-        # Check component-specific kill switch
-        component_switch = self._kill_switches.get(f"kill-{component}")
-        if component_switch and component_switch.is_triggered:
-            return False
-
-        # Check background kill switch for background jobs
-        if priority == QueuePriority.BACKGROUND:
-            bg_switch = self._kill_switches.get("kill-background")
-            if bg_switch and bg_switch.is_triggered:
-                return False
-
-        return True
+        blocked = self._blocked_for_all | self._blocked_by_component.get(component, 0)
+        return not blocked & (1 << priority.value)
 
 
 # =============================================================================
@@ -846,7 +1016,7 @@ class CapacityManager:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PrivacyPolicy:
     """Privacy policy configuration."""
 
@@ -860,7 +1030,7 @@ class PrivacyPolicy:
     anonymization_enabled: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DataRetentionRecord:
     """Data retention tracking record."""
 
@@ -884,6 +1054,10 @@ class PrivacyManager:
         "ssn": re.compile(r"\b\d{3}-\d{2}-\d{4}\b"),
         "ip_address": re.compile(r"\b(?:\d{1,3}\.){3}\d{1,3}\b"),
     }
+    _PII_SUBSTITUTIONS: tuple[tuple[re.Pattern[str], str], ...] = tuple(
+        (pattern, f"[{pii_type.upper()}_REDACTED]")
+        for pii_type, pattern in PII_PATTERNS.items()
+    )
 
     def __init__(self) -> None:
         self._policy = PrivacyPolicy(
@@ -891,8 +1065,10 @@ class PrivacyManager:
             name="Default Privacy Policy",
         )
         self._retention_records: list[DataRetentionRecord] = []
+        self._retention_positions: dict[str, int] = {}  # record_id -> list index
         self._external_providers: dict[str, bool] = {}  # provider_id -> is_opted_in
         self._counter = 0
+        self._version = 0  # see OperationsEngine._state_versions
 
     def get_policy(self) -> PrivacyPolicy:
         """Get current privacy policy."""
@@ -901,6 +1077,7 @@ class PrivacyManager:
     def update_policy(self, **kwargs: Any) -> PrivacyPolicy:
         """Update privacy policy."""
         self._policy = replace(self._policy, **kwargs)
+        self._version += 1
         return self._policy
 
     def is_local_first(self) -> bool:
@@ -926,9 +1103,21 @@ class PrivacyManager:
         if not self._policy.pii_redaction_enabled:
             return text
 
-        redacted = text
-        for pii_type, pattern in self.PII_PATTERNS.items():
-            redacted = pattern.sub(f"[{pii_type.upper()}_REDACTED]", redacted)
+        for pattern, replacement in self._PII_SUBSTITUTIONS:
+            text = pattern.sub(replacement, text)
+        return text
+
+    def redact_many(self, texts: Iterable[str]) -> list[str]:
+        """Redact PII from a batch of texts."""
+        if not self._policy.pii_redaction_enabled:
+            return list(texts)
+
+        substitutions = self._PII_SUBSTITUTIONS
+        redacted = []
+        for text in texts:
+            for pattern, replacement in substitutions:
+                text = pattern.sub(replacement, text)
+            redacted.append(text)
         return redacted
 
     def create_retention_record(
@@ -951,7 +1140,9 @@ class PrivacyManager:
             retention_days=retention,
             expires_at=expires.isoformat(),
         )
+        self._retention_positions[record.record_id] = len(self._retention_records)
         self._retention_records.append(record)
+        self._version += 1
         return record
 
     def get_expired_records(self) -> list[DataRetentionRecord]:
@@ -959,31 +1150,47 @@ class PrivacyManager:
         now = datetime.now(UTC).isoformat()
         return [r for r in self._retention_records if r.expires_at < now]
 
+    def _next_expiry(self, now: str) -> str | None:
+        """Earliest expiry among records that have not expired yet."""
+        return min(
+            (r.expires_at for r in self._retention_records if r.expires_at >= now),
+            default=None,
+        )
+
     def redact_record(self, record_id: str) -> DataRetentionRecord | None:
         """Redact a data record."""
-        for i, record in enumerate(self._retention_records):
-            if record.record_id == record_id:
-                updated = replace(
-                    record,
-                    is_redacted=True,
-                    redacted_at=_timestamp(),
-                )
-                self._retention_records[i] = updated
-                return updated
-        return None
+        position = self._retention_positions.get(record_id)
+        if position is None:
+            return None
+        return self._redact_at(position, _timestamp())
+
+    def _redact_at(self, position: int, redacted_at: str) -> DataRetentionRecord:
+        """Replace the record at a list position with its redacted copy."""
+        updated = replace(
+            self._retention_records[position],
+            is_redacted=True,
+            redacted_at=redacted_at,
+        )
+        self._retention_records[position] = updated
+        self._version += 1
+        return updated
 
     def enforce_retention(self) -> dict[str, int]:
         """Enforce retention policy on expired records."""
-        expired = self.get_expired_records()
+        now = _timestamp()
+        expired_count = 0
         redacted_count = 0
 
-        for record in expired:
-            if not record.is_redacted:
-                self.redact_record(record.record_id)
-                redacted_count += 1
+        # Single pass: records are redacted in place as they are found.
+        for position, record in enumerate(self._retention_records):
+            if record.expires_at < now:
+                expired_count += 1
+                if not record.is_redacted:
+                    self._redact_at(position, now)
+                    redacted_count += 1
 
         return {
-            "expired_records": len(expired),
+            "expired_records": expired_count,
             "redacted": redacted_count,
         }
 
@@ -993,7 +1200,7 @@ class PrivacyManager:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceAttestation:
     """Source material rights attestation."""
 
@@ -1010,7 +1217,7 @@ class SourceAttestation:
     notes: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelLicense:
     """Model/checkpoint/adapter license record."""
 
@@ -1026,7 +1233,7 @@ class ModelLicense:
     registered_at: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExportPolicyGate:
     """Policy gate for export/share workflows."""
 
@@ -1070,15 +1277,26 @@ DEFAULT_EXPORT_GATES: tuple[ExportPolicyGate, ...] = (
 )
 
 
+_DEFAULT_EXPORT_GATES_BY_ID: Mapping[str, ExportPolicyGate] = MappingProxyType(
+    {g.gate_id: g for g in DEFAULT_EXPORT_GATES}
+)
+
+
 class ComplianceManager:
     """G9.5: Legal and license compliance."""
 
-    def __init__(self) -> None:
+    def __init__(self, *, hash_algorithm: str = "sha256") -> None:
+        # Fail at construction rather than on the first attestation; this also
+        # rejects variable-length digests (shake_*) and a missing blake3.
+        try:
+            _hash_content("", hash_algorithm)
+        except (ImportError, TypeError, ValueError) as exc:
+            raise ValueError(f"Unsupported hash algorithm: {hash_algorithm}") from exc
+        self._hash_algorithm = hash_algorithm
         self._attestations: dict[str, SourceAttestation] = {}
+        self._attestations_by_hash: dict[str, SourceAttestation] = {}
         self._licenses: dict[str, ModelLicense] = {}
-        self._export_gates: dict[str, ExportPolicyGate] = {
-            g.gate_id: g for g in DEFAULT_EXPORT_GATES
-        }
+        self._export_gates = _DEFAULT_EXPORT_GATES_BY_ID
         self._counter = 0
 
     def attest_source_rights(
@@ -1099,7 +1317,7 @@ class ComplianceManager:
         attestation = SourceAttestation(
             attestation_id=f"att-{self._counter:04d}",
             source_path=source_path,
-            source_hash=_hash_content(source_content),
+            source_hash=_hash_content(source_content, self._hash_algorithm),
             has_distribution_rights=has_distribution_rights,
             has_derivative_rights=has_derivative_rights,
             license_type=license_type,
@@ -1110,6 +1328,8 @@ class ComplianceManager:
             notes=notes,
         )
         self._attestations[attestation.attestation_id] = attestation
+        # The earliest attestation for a given source stays authoritative.
+        self._attestations_by_hash.setdefault(attestation.source_hash, attestation)
         return attestation
 
     def get_attestation(self, attestation_id: str) -> SourceAttestation | None:
@@ -1118,10 +1338,7 @@ class ComplianceManager:
 
     def verify_source_rights(self, source_hash: str) -> SourceAttestation | None:
         """Verify rights for a source by its content hash."""
-        for attestation in self._attestations.values():
-            if attestation.source_hash == source_hash:
-                return attestation
-        return None
+        return self._attestations_by_hash.get(source_hash)
 
     def register_model_license(
         self,
@@ -1218,7 +1435,7 @@ class ComplianceManager:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContentPolicyProfile:
     """Content policy profile by deployment context."""
 
@@ -1231,7 +1448,7 @@ class ContentPolicyProfile:
     warning_labels: tuple[str, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContentOverrideRecord:
     """Explicit confirmation and override logging."""
 
@@ -1246,7 +1463,7 @@ class ContentOverrideRecord:
     content_hash: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewQueueItem:
     """Item in the content review queue."""
 
@@ -1304,18 +1521,39 @@ DEFAULT_POLICY_PROFILES: tuple[ContentPolicyProfile, ...] = (
 )
 
 
+_DEFAULT_POLICY_PROFILES_BY_ID: Mapping[str, ContentPolicyProfile] = MappingProxyType(
+    {p.profile_id: p for p in DEFAULT_POLICY_PROFILES}
+)
+
+
+def _profile_rules(
+    profile: ContentPolicyProfile,
+) -> tuple[int, frozenset[str], frozenset[str]]:
+    """Resolve a profile's maximum band rank and label sets."""
+    return (
+        ContentGovernanceManager.MATURITY_BAND_ORDER.index(profile.max_maturity_band),
+        frozenset(profile.blocked_labels),
+        frozenset(profile.warning_labels),
+    )
+
+
 class ContentGovernanceManager:
     """G9.6: Mature-content governance."""
 
     MATURITY_BAND_ORDER = ("all_ages", "teen", "mature", "explicit")
 
     def __init__(self) -> None:
-        self._profiles: dict[str, ContentPolicyProfile] = {
-            p.profile_id: p for p in DEFAULT_POLICY_PROFILES
+        # Copied, since set_policy_profile adds and replaces entries.
+        self._profiles = dict(_DEFAULT_POLICY_PROFILES_BY_ID)
+        # Resolved per profile id and rebuilt whenever a profile is set.
+        self._rules_by_profile_id = {
+            profile_id: _profile_rules(profile)
+            for profile_id, profile in self._profiles.items()
         }
         self._overrides: list[ContentOverrideRecord] = []
         self._review_queue: list[ReviewQueueItem] = []
         self._counter = 0
+        self._version = 0  # see OperationsEngine._state_versions
 
     def get_policy_profile(self, profile_id: str) -> ContentPolicyProfile | None:
         """Get policy profile by ID."""
@@ -1342,6 +1580,7 @@ class ContentGovernanceManager:
             warning_labels=warning_labels,
         )
         self._profiles[profile_id] = profile
+        self._rules_by_profile_id[profile_id] = _profile_rules(profile)
         return profile
 
     def check_content_against_profile(
@@ -1355,14 +1594,41 @@ class ContentGovernanceManager:
         profile = self._profiles.get(profile_id)
         if profile is None:
             return {"error": "Profile not found"}
+        return self._check_content(
+            profile, maturity_band, setting_values, detected_labels
+        )
 
+    def check_many_against_profile(
+        self,
+        profile_id: str,
+        items: Iterable[tuple[str, dict[str, float], list[str]]],
+    ) -> list[dict[str, Any]]:
+        """Check a batch of (maturity_band, setting_values, labels) items."""
+        profile = self._profiles.get(profile_id)
+        if profile is None:
+            return [{"error": "Profile not found"} for _ in items]
+        return [
+            self._check_content(profile, maturity_band, setting_values, labels)
+            for maturity_band, setting_values, labels in items
+        ]
+
+    def _check_content(
+        self,
+        profile: ContentPolicyProfile,
+        maturity_band: str,
+        setting_values: dict[str, float],
+        detected_labels: list[str],
+    ) -> dict[str, Any]:
+        """Check one content item against an already resolved profile."""
+        max_level, blocked_labels, warning_labels = self._rules_by_profile_id[
+            profile.profile_id
+        ]
         violations = []
         requires_confirmation = False
         requires_review = False
 
         # Check maturity band
         content_level = self.MATURITY_BAND_ORDER.index(maturity_band)
-        max_level = self.MATURITY_BAND_ORDER.index(profile.max_maturity_band)
         if content_level > max_level:
             violations.append(
                 f"Maturity band '{maturity_band}' exceeds profile maximum"
@@ -1370,7 +1636,7 @@ class ContentGovernanceManager:
 
         # Check blocked labels
         for label in detected_labels:
-            if label in profile.blocked_labels:
+            if label in blocked_labels:
                 violations.append(f"Blocked label detected: {label}")
 
         # Check setting values
@@ -1381,12 +1647,10 @@ class ContentGovernanceManager:
             requires_confirmation = True
 
         # Check warning labels
-        warnings = [
-            label for label in detected_labels if label in profile.warning_labels
-        ]
+        warnings = [label for label in detected_labels if label in warning_labels]
 
         return {
-            "profile_id": profile_id,
+            "profile_id": profile.profile_id,
             "allowed": len(violations) == 0,
             "violations": violations,
             "warnings": warnings,
@@ -1442,6 +1706,7 @@ class ContentGovernanceManager:
             submitted_by=submitted_by,
         )
         self._review_queue.append(item)
+        self._version += 1
         return item
 
     def review_item(
@@ -1462,6 +1727,7 @@ class ContentGovernanceManager:
                     review_notes=notes,
                 )
                 self._review_queue[i] = updated
+                self._version += 1
                 return updated
         return None
 
@@ -1483,7 +1749,7 @@ class ContentGovernanceManager:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Phase9Metrics:
     """Aggregated metrics for Phase 9 done-criteria validation."""
 
@@ -1497,6 +1763,10 @@ class Phase9Metrics:
     policy_violations_24h: int
 
 
+# (manager versions, earliest pending retention expiry, metrics)
+_Phase9CacheEntry = tuple[tuple[int, ...], str | None, Phase9Metrics]
+
+
 class OperationsEngine:
     """Main operations engine aggregating all Phase 9 managers."""
 
@@ -1507,9 +1777,32 @@ class OperationsEngine:
         self.privacy = PrivacyManager()
         self.compliance = ComplianceManager()
         self.governance = ContentGovernanceManager()
+        self._phase9_cache: _Phase9CacheEntry | None = None
+
+    def _state_versions(self) -> tuple[int, ...]:
+        """Versions of the managers the done criteria read from."""
+        return (
+            self.observability._version,
+            self.capacity._version,
+            self.privacy._version,
+            self.governance._version,
+        )
 
     def evaluate_phase9_done_criteria(self) -> Phase9Metrics:
-        """Evaluate Phase 9 done criteria."""
+        """Evaluate Phase 9 done criteria.
+
+        The result is reused until a manager it reads from changes or a
+        retention record reaches its expiry.
+        """
+        versions = self._state_versions()
+        now = _timestamp()
+        if self._phase9_cache is not None:
+            cached_versions, next_expiry, cached_metrics = self._phase9_cache
+            if cached_versions == versions and (
+                next_expiry is None or now <= next_expiry
+            ):
+                return cached_metrics
+
         # Security and privacy compliance
         policy = self.privacy.get_policy()
         security_privacy_pass = (
@@ -1518,7 +1811,12 @@ class OperationsEngine:
             and policy.external_provider_opt_in_required
         )
 
-        # SLO dashboards (active if we have recent measurements)
+        # Count breached SLOs
+        breached_slos = len(self.observability.get_breached_slos())
+
+        # SLO dashboards (active if we have recent measurements). Read after
+        # measuring above, so the result already reflects this evaluation's
+        # own measurements and a repeat evaluation would return the same.
         recent_measurements = any(
             self.observability._slo_measurements[slo]
             for slo in self.observability._slo_definitions
@@ -1528,9 +1826,6 @@ class OperationsEngine:
         # Budget controls (active if any budgets exist)
         budget_controls_active = len(self.capacity._budgets) > 0
 
-        # Count breached SLOs
-        breached_slos = len(self.observability.get_breached_slos())
-
         # Count active kill switches
         active_kills = len(self.capacity.get_active_kill_switches())
 
@@ -1543,7 +1838,7 @@ class OperationsEngine:
         # Policy violations (would be tracked separately in production)
         policy_violations = 0
 
-        return Phase9Metrics(
+        metrics = Phase9Metrics(
             security_privacy_compliance_pass=security_privacy_pass,
             slo_dashboards_active=slo_dashboards_active,
             budget_controls_active=budget_controls_active,
@@ -1553,6 +1848,10 @@ class OperationsEngine:
             pending_reviews=pending_reviews,
             policy_violations_24h=policy_violations,
         )
+        # Measurements recorded while evaluating do not bump any version: they
+        # only follow from latency samples, which already do.
+        self._phase9_cache = (versions, self.privacy._next_expiry(now), metrics)
+        return metrics
 
 
 __all__ = [
@@ -1562,8 +1861,10 @@ __all__ = [
     "ContentGovernanceManager",
     "ContentOverrideRecord",
     "ContentPolicyProfile",
+    "correlation_scope",
     "DataRetentionRecord",
     "DEFAULT_EXPORT_GATES",
+    "DEFAULT_KILL_SWITCHES",
     "DEFAULT_RUNBOOKS",
     "DEFAULT_SLOS",
     "ExportPolicyGate",
@@ -16,6 +16,7 @@ The script will:
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 import uuid
 from pathlib import Path
@@ -27,10 +28,10 @@ from agents.archivist import (
     SUPPORTED_MANGA_IMAGE_EXTENSIONS,
     DEFAULT_INGESTION_POLICY,
     IngestionPolicy,
+    compute_manga_folder_fingerprint,
     ingest_image_folder_pages,
     list_manga_image_pages,
 )
-from core.manga_storage import get_manga_storage, MangaVolume, MangaPage
 
 
 def main() -> int:
@@ -56,6 +57,17 @@ def main() -> int:
         action="store_true",
         help="Don't create a graph node for this manga",
     )
+    parser.add_argument(
+        "--resolve-symlinks",
+        action="store_true",
+        help="Resolve symlinks in the folder path before importing",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of processes used for page analysis (default: CPU count)",
+    )
     parser.add_argument(
         "--db-path",
         type=str,
@@ -65,7 +77,11 @@ def main() -> int:
 
     args = parser.parse_args()
 
-    folder_path = args.folder.resolve()
+    # abspath avoids a realpath walk; resolve only when symlinks matter
+    if args.resolve_symlinks:
+        folder_path = args.folder.resolve()
+    else:
+        folder_path = Path(os.path.abspath(args.folder))
     title = args.title or folder_path.name
 
     # Validate folder
@@ -92,8 +108,9 @@ def main() -> int:
 
     # Show first few pages
     print("First 5 pages:")
-    for i, page in enumerate(pages[:5], 1):
-        print(f"  {i}. {page.name}")
+    sys.stdout.write(
+        "".join(f"  {i}. {page.name}\n" for i, page in enumerate(pages[:5], 1))
+    )
     if len(pages) > 5:
         print(f"  ... and {len(pages) - 5} more")
     print()
@@ -102,9 +119,24 @@ def main() -> int:
         print("✅ Dry run complete. Use without --dry-run to import.")
         return 0
 
+    # Storage is only needed past the dry-run exit, so import it lazily
+    from core.manga_storage import MangaPage, MangaVolume, get_manga_storage
+
+    # Skip ingestion entirely when this exact listing was imported before
+    storage = get_manga_storage(args.db_path)
+    listing_fingerprint = compute_manga_folder_fingerprint(pages)
+    existing = storage.get_volume_by_listing_fingerprint(listing_fingerprint)
+    if existing:
+        print(f"⚠️  This folder was already imported: '{existing.title}'")
+        print(f"   Volume ID: {existing.volume_id}")
+        return 0
+
     # Import with extended timeout for large folders
     print("🔄 Importing pages...")
     print("   (This may take a while for large volumes with OCR)")
+    # Output is block-buffered when redirected; surface progress before the
+    # long-running ingestion starts.
+    sys.stdout.flush()
 
     # Use non-sandbox mode with extended timeout for CLI
     policy = IngestionPolicy(
@@ -114,6 +146,7 @@ def main() -> int:
         max_archive_uncompressed_bytes=2 * 1024 * 1024 * 1024,  # 2GB
         max_compression_ratio=100.0,
         worker_timeout_seconds=300.0,  # 5 minutes for large imports
+        page_analysis_workers=max(1, args.workers),
     )
 
     try:
@@ -139,17 +172,19 @@ def main() -> int:
 
         print()
         print("Page details:")
-        for i, meta in enumerate(report.page_metadata[:10], 1):
-            print(f"  Page {i}: {meta.format_name}, " f"{meta.width}x{meta.height}")
+        sys.stdout.write(
+            "".join(
+                f"  Page {i}: {meta.format_name}, {meta.width}x{meta.height}\n"
+                for i, meta in enumerate(report.page_metadata[:10], 1)
+            )
+        )
         if len(report.page_metadata) > 10:
             print(f"  ... and {len(report.page_metadata) - 10} more pages")
 
         # Save to manga storage
         print()
         print("💾 Saving to manga storage...")
-        
-        storage = get_manga_storage(args.db_path)
-        
+
         # Check for existing volume with same hash
         existing = storage.get_volume_by_hash(report.source_hash)
         if existing:
@@ -159,27 +194,6 @@ def main() -> int:
 
         # Create volume record
         volume_id = f"manga_{uuid.uuid4().hex[:12]}"
-        
-        manga_pages = tuple(
-            MangaPage(
-                page_number=i + 1,
-                format_name=meta.format_name,
-                width=meta.width,
-                height=meta.height,
-                content_hash=meta.content_hash,
-                ocr_text=getattr(meta, 'ocr_text', ''),  # OCR text if available
-            )
-            for i, meta in enumerate(report.page_metadata)
-        )
-
-        volume = MangaVolume(
-            volume_id=volume_id,
-            title=title,
-            source_path=str(folder_path),
-            page_count=report.page_count,
-            source_hash=report.source_hash,
-            pages=manga_pages,
-        )
 
         # Optionally create graph node first (before saving volume with link)
         graph_node_id = None
@@ -211,9 +225,8 @@ def main() -> int:
                     },
                 )
                 
-                # Use async method in sync context
-                import asyncio
-                success = asyncio.run(graph_db.save_node(node))
+                # Plain SQLite write; no event loop needed in a sync CLI
+                success = graph_db.save_node_sync(node)
                 
                 if success:
                     graph_node_id = node_id
@@ -225,19 +238,29 @@ def main() -> int:
                 print(f"⚠️  Could not create graph node: {e}")
                 print("   Manga will be saved but won't appear in the graph. Use --no-graph-node to skip this.")
         
-        # Update volume with graph_node_id and save
-        if graph_node_id:
-            volume = MangaVolume(
-                volume_id=volume_id,
-                title=title,
-                source_path=str(folder_path),
-                page_count=report.page_count,
-                source_hash=report.source_hash,
-                pages=manga_pages,
-                graph_node_id=graph_node_id,
+        # Pages are generated lazily and streamed into storage in chunks
+        manga_pages = (
+            MangaPage(
+                page_number=i + 1,
+                format_name=meta.format_name,
+                width=meta.width,
+                height=meta.height,
+                content_hash=meta.content_hash,
             )
-        
-        if storage.save_volume(volume):
+            for i, meta in enumerate(report.page_metadata)
+        )
+
+        volume = MangaVolume(
+            volume_id=volume_id,
+            title=title,
+            source_path=str(folder_path),
+            page_count=report.page_count,
+            source_hash=report.source_hash,
+            graph_node_id=graph_node_id,
+            listing_fingerprint=listing_fingerprint,
+        )
+
+        if storage.save_volume_streaming(volume, manga_pages):
             print(f"✅ Saved manga volume: {volume_id}")
             print(f"   Title: {title}")
             print(f"   Pages: {report.page_count}")
@@ -0,0 +1,27 @@
+"""Shared PIL access and encoded-image payloads for tests."""
+
+from __future__ import annotations
+
+import functools
+import io
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image", reason="Pillow is required for image tests")
+
+
+@functools.lru_cache(maxsize=64)
+def image_bytes(
+    *,
+    mode: str,
+    size: tuple[int, int],
+    image_format: str,
+    color: int | tuple[int, ...] | None = None,
+) -> bytes:
+    """Encode a solid-color image once per distinct set of arguments."""
+    if color is None:
+        color = (255, 0, 0, 180) if "A" in mode else 120
+    image = Image.new(mode, size, color)
+    payload = io.BytesIO()
+    image.save(payload, format=image_format)
+    return payload.getvalue()
@@ -2,10 +2,43 @@
 
 from __future__ import annotations
 
+import os
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 
+import pytest
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
+
+_TMPFS_ROOT = Path("/dev/shm")
+_TMPFS_BASETEMP = pytest.StashKey[str]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Place ``tmp_path`` on tmpfs when ``LOOM_TEST_TMPFS`` is set.
+
+    The ingestion entry points only accept filesystem paths, so the ingestion
+    suites write many small files; on CI a RAM-backed basetemp avoids the disk
+    round trips. Each run gets its own directory, so concurrent runs never
+    share or wipe each other's basetemp. An explicit ``--basetemp`` always wins.
+    """
+
+    if not os.environ.get("LOOM_TEST_TMPFS") or config.option.basetemp:
+        return
+    if _TMPFS_ROOT.is_dir():
+        basetemp = tempfile.mkdtemp(dir=_TMPFS_ROOT, prefix="the-loom-pytest-")
+        config.stash[_TMPFS_BASETEMP] = basetemp
+        config.option.basetemp = basetemp
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Remove the tmpfs basetemp created for this run; tmpfs is RAM."""
+
+    basetemp = config.stash.get(_TMPFS_BASETEMP, None)
+    if basetemp is not None:
+        shutil.rmtree(basetemp, ignore_errors=True)
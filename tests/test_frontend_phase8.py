@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import time
+from dataclasses import replace
+
+import pytest
 from core.frontend_workflow_engine import (
     AccessibilityManager,
     BranchStatus,
     BranchWorkflowManager,
     DualViewManager,
+    DualViewState,
     GraphViewport,
     GraphWorkspace,
     KeyboardShortcut,
@@ -18,37 +23,42 @@ from core.frontend_workflow_engine import (
 )
 
 
+@pytest.fixture
+def scene_viewport() -> GraphViewport:
+    return GraphViewport(x=0, y=0, width=1200, height=800, zoom=1.0)
+
+
+@pytest.fixture
+def scene_workspace(scene_viewport: GraphViewport) -> GraphWorkspace:
+    return GraphWorkspace(scene_viewport)
+
+
 class TestG81InteractiveGraphUX:
     """G8.1: Interactive graph UX with virtualization."""
 
-    def test_graph_workspace_creation(self) -> None:
+    def test_graph_workspace_creation(self, scene_workspace: GraphWorkspace) -> None:
         """Graph workspace initializes with viewport."""
-        viewport = GraphViewport(x=0, y=0, width=1200, height=800, zoom=1.0)
-        workspace = GraphWorkspace(viewport)
-
-        assert workspace.zoom_mode == ZoomMode.SCENE
-
-    def test_semantic_zoom_modes(self) -> None:
+        assert scene_workspace.zoom_mode == ZoomMode.SCENE
+
+    @pytest.mark.parametrize(
+        ("zoom", "expected"),
+        [
+            (0.5, ZoomMode.OVERVIEW),
+            (1.0, ZoomMode.SCENE),
+            (2.0, ZoomMode.DETAIL),
+        ],
+    )
+    def test_semantic_zoom_modes(self, zoom: float, expected: ZoomMode) -> None:
         """Zoom modes transition at correct thresholds."""
-        viewport_overview = GraphViewport(x=0, y=0, width=1200, height=800, zoom=0.5)
-        workspace_overview = GraphWorkspace(viewport_overview)
-        assert workspace_overview.zoom_mode == ZoomMode.OVERVIEW
-
-        viewport_scene = GraphViewport(x=0, y=0, width=1200, height=800, zoom=1.0)
-        workspace_scene = GraphWorkspace(viewport_scene)
-        assert workspace_scene.zoom_mode == ZoomMode.SCENE
+        viewport = GraphViewport(x=0, y=0, width=1200, height=800, zoom=zoom)
+        workspace = GraphWorkspace(viewport)
 
-        viewport_detail = GraphViewport(x=0, y=0, width=1200, height=800, zoom=2.0)
-        workspace_detail = GraphWorkspace(viewport_detail)
-        assert workspace_detail.zoom_mode == ZoomMode.DETAIL
+        assert workspace.zoom_mode == expected
 
-    def test_undo_redo_functionality(self) -> None:
+    def test_undo_redo_functionality(self, scene_workspace: GraphWorkspace) -> None:
         """Undo/redo works for graph operations."""
         from core.frontend_workflow_engine import GraphNodeView
 
-        viewport = GraphViewport(x=0, y=0, width=1200, height=800, zoom=1.0)
-        workspace = GraphWorkspace(viewport)
-
         # Add a node
         node = GraphNodeView(
             node_id="test-1",
@@ -58,25 +68,24 @@ class TestG81InteractiveGraphUX:
             x=100,
             y=100,
         )
-        workspace.add_node(node)
+        scene_workspace.add_node(node)
 
         # Undo
-        assert workspace.undo() is True
+        assert scene_workspace.undo() is True
 
         # Redo
-        assert workspace.redo() is True
+        assert scene_workspace.redo() is True
 
-    def test_autosave_checkpoint_creation(self) -> None:
+    def test_autosave_checkpoint_creation(
+        self, scene_workspace: GraphWorkspace
+    ) -> None:
         """Autosave checkpoints are created with hashes."""
-        viewport = GraphViewport(x=0, y=0, width=1200, height=800, zoom=1.0)
-        workspace = GraphWorkspace(viewport)
-
-        checkpoint = workspace.create_autosave("test-checkpoint")
+        checkpoint = scene_workspace.create_autosave("test-checkpoint")
 
         assert checkpoint.checkpoint_id.startswith("autosave:")
         assert checkpoint.reason == "test-checkpoint"
         assert checkpoint.snapshot_hash
-        assert len(workspace.autosaves) == 1
+        assert len(scene_workspace.autosaves) == 1
 
     def test_virtualization_metrics(self) -> None:
         """Virtualization metrics calculated correctly."""
@@ -90,25 +99,51 @@ class TestG81InteractiveGraphUX:
         assert metrics.estimated_frame_ms > 0
         assert metrics.mode in (ZoomMode.OVERVIEW, ZoomMode.SCENE, ZoomMode.DETAIL)
 
-    def test_performance_usable_thresholds(self) -> None:
+    def test_performance_usable_thresholds(
+        self, scene_workspace: GraphWorkspace
+    ) -> None:
         """Performance usability respects frame time and virtualization."""
-        viewport = GraphViewport(x=0, y=0, width=1200, height=800, zoom=1.0)
-        workspace = GraphWorkspace(viewport)
-
         # Empty workspace with no virtualization may not meet ratio threshold
         # but should still have acceptable frame time
-        metrics = workspace.render_metrics()
+        metrics = scene_workspace.render_metrics()
         assert metrics.estimated_frame_ms <= 16.0
 
+    @pytest.mark.perf
+    def test_bulk_add_node_linear(self, scene_workspace: GraphWorkspace) -> None:
+        """Adding 1000 nodes with undo snapshots stays within budget."""
+        from core.frontend_workflow_engine import GraphNodeView
+
+        started = time.perf_counter()
+        for index in range(1000):
+            scene_workspace.add_node(
+                GraphNodeView(
+                    node_id=f"node-{index:04d}",
+                    label=f"Node {index}",
+                    branch_id="main",
+                    scene_id=f"scene-{index}",
+                    x=index * 20,
+                    y=100,
+                )
+            )
+        elapsed = time.perf_counter() - started
+
+        assert scene_workspace.render_metrics().total_nodes == 1000
+        assert elapsed < 0.2
+
+
+@pytest.fixture
+def branch_manager() -> BranchWorkflowManager:
+    return BranchWorkflowManager()
+
 
 class TestG82BranchingWorkflowUX:
     """G8.2: Branching workflow UX."""
 
-    def test_branch_creation_from_node(self) -> None:
+    def test_branch_creation_from_node(
+        self, branch_manager: BranchWorkflowManager
+    ) -> None:
         """Branches can be created from any node."""
-        manager = BranchWorkflowManager()
-
-        branch = manager.create_branch(
+        branch = branch_manager.create_branch(
             source_node_id="node-1",
             label="Alternate Timeline",
             parent_branch_id="main",
@@ -120,14 +155,14 @@ class TestG82BranchingWorkflowUX:
         assert branch.status == BranchStatus.ACTIVE
         assert "main" in branch.lineage
 
-    def test_branch_lineage_tracking(self) -> None:
+    def test_branch_lineage_tracking(
+        self, branch_manager: BranchWorkflowManager
+    ) -> None:
         """Branch lineage is tracked correctly."""
-        manager = BranchWorkflowManager()
-
-        branch1 = manager.create_branch(
+        branch1 = branch_manager.create_branch(
             source_node_id="node-1", label="Branch 1", parent_branch_id="main"
         )
-        branch2 = manager.create_branch(
+        branch2 = branch_manager.create_branch(
             source_node_id="node-2",
             label="Branch 2",
             parent_branch_id=branch1.branch_id,
@@ -135,52 +170,55 @@ class TestG82BranchingWorkflowUX:
 
         assert branch2.lineage == (*branch1.lineage, branch2.branch_id)
 
-    def test_impact_preview_calculation(self) -> None:
+    def test_impact_preview_calculation(
+        self, branch_manager: BranchWorkflowManager
+    ) -> None:
         """Impact preview shows descendant count and score."""
         from core.frontend_workflow_engine import GraphNodeView
 
         viewport = GraphViewport(x=0, y=0, width=1200, height=800, zoom=1.0)
         graph = GraphWorkspace(viewport)
-        manager = BranchWorkflowManager()
 
-        # Add nodes
+        template = GraphNodeView(
+            node_id="", label="", branch_id="main", scene_id="", x=0, y=100
+        )
         for i in range(3):
-            node = GraphNodeView(
-                node_id=f"node-{i}",
-                label=f"Node {i}",
-                branch_id="main",
-                scene_id=f"scene-{i}",
-                x=i * 200,
-                y=100,
+            graph.add_node(
+                replace(
+                    template,
+                    node_id=f"node-{i}",
+                    label=f"Node {i}",
+                    scene_id=f"scene-{i}",
+                    x=i * 200,
+                )
             )
-            graph.add_node(node)
 
-        preview = manager.preview_impact("node-0", graph)
+        preview = branch_manager.preview_impact("node-0", graph)
 
         assert preview.descendant_count >= 0
         assert 0.0 <= preview.divergence_score <= 1.0
         assert preview.summary
 
-    def test_branch_archive_action(self) -> None:
+    def test_branch_archive_action(self, branch_manager: BranchWorkflowManager) -> None:
         """Branches can be archived with reason."""
-        manager = BranchWorkflowManager()
-        branch = manager.create_branch(
+        branch = branch_manager.create_branch(
             source_node_id="node-1", label="To Archive", parent_branch_id="main"
         )
 
-        archived = manager.archive_branch(branch.branch_id, reason="no longer needed")
+        archived = branch_manager.archive_branch(
+            branch.branch_id, reason="no longer needed"
+        )
 
         assert archived.status == BranchStatus.ARCHIVED
         assert archived.archive_reason == "no longer needed"
 
-    def test_branch_merge_action(self) -> None:
+    def test_branch_merge_action(self, branch_manager: BranchWorkflowManager) -> None:
         """Branches can be merged into another."""
-        manager = BranchWorkflowManager()
-        source = manager.create_branch(
+        source = branch_manager.create_branch(
             source_node_id="node-1", label="Source", parent_branch_id="main"
         )
 
-        merged = manager.merge_branch(
+        merged = branch_manager.merge_branch(
             source_branch_id=source.branch_id, target_branch_id="main"
         )
 
@@ -234,13 +272,22 @@ class TestG83TunerControlPanel:
         assert "Expected scene intensity" in preview.intensity_summary
 
 
+@pytest.fixture(scope="class")
+def dual_view_initialized() -> tuple[DualViewManager, DualViewState]:
+    """Read-only manager with scene-1 initialized at v1/v1."""
+    manager = DualViewManager()
+    state = manager.initialize("scene-1", text_version="v1", image_version="v1")
+    return manager, state
+
+
 class TestG84DualViewDirectorMode:
     """G8.4: Dual-view and Director Mode."""
 
-    def test_dual_view_initialization(self) -> None:
+    def test_dual_view_initialization(
+        self, dual_view_initialized: tuple[DualViewManager, DualViewState]
+    ) -> None:
         """Dual view initializes with synced state."""
-        manager = DualViewManager()
-        state = manager.initialize("scene-1", text_version="v1", image_version="v1")
+        _, state = dual_view_initialized
 
         assert state.scene_id == "scene-1"
         assert state.text_status == PaneSyncStatus.SYNCED
@@ -278,11 +325,11 @@ class TestG84DualViewDirectorMode:
         assert state.image_status in stale_statuses
         assert len(state.panel_redraws) == 1
 
-    def test_sync_badges_non_color_indicators(self) -> None:
+    def test_sync_badges_non_color_indicators(
+        self, dual_view_initialized: tuple[DualViewManager, DualViewState]
+    ) -> None:
         """Sync badges use non-color indicators."""
-        manager = DualViewManager()
-        state = manager.initialize("scene-1", text_version="v1", image_version="v1")
-
+        _, state = dual_view_initialized
         badges = state.badges
 
         # All badges should have icons (non-color indicators)
@@ -312,73 +359,114 @@ class TestG84DualViewDirectorMode:
         assert state.text_version == "v2"
         assert state.image_version == "v2"
 
-    def test_sync_state_visibility(self) -> None:
+    def test_sync_state_visibility(
+        self, dual_view_initialized: tuple[DualViewManager, DualViewState]
+    ) -> None:
         """Sync state is always visible when active."""
-        manager = DualViewManager()
-        manager.initialize("scene-1", text_version="v1", image_version="v1")
+        manager, _ = dual_view_initialized
 
         assert manager.is_sync_state_visible("scene-1") is True
 
-    def test_sync_state_accuracy(self) -> None:
+    def test_sync_state_accuracy(
+        self, dual_view_initialized: tuple[DualViewManager, DualViewState]
+    ) -> None:
         """Sync state accuracy reflects version match."""
-        manager = DualViewManager()
-        manager.initialize("scene-1", text_version="v1", image_version="v1")
+        manager, _ = dual_view_initialized
 
         # When synced and versions match
         assert manager.is_sync_state_accurate("scene-1") is True
 
 
-class TestG85AccessibilityMobileReadiness:
-    """G8.5: Accessibility and mobile readiness."""
-
-    def test_responsive_layout_mobile(self) -> None:
-        """Mobile layout has correct settings."""
-        manager = AccessibilityManager()
-        layout = manager.layout_for_width(375)
-
-        assert layout.breakpoint == "mobile"
-        assert layout.controls_stacked is True
-        assert layout.dual_view_stacked is True
-        assert layout.graph_columns == 1
+# Full keyboard, label and indicator coverage for the critical flows.
+_FULL_SHORTCUTS = (
+    KeyboardShortcut(
+        key="key-create_branch", action="create_branch", description="Create branch"
+    ),
+    KeyboardShortcut(key="key-undo", action="undo", description="Undo"),
+    KeyboardShortcut(key="key-redo", action="redo", description="Redo"),
+    KeyboardShortcut(key="key-zoom_in", action="zoom_in", description="Zoom in"),
+    KeyboardShortcut(key="key-zoom_out", action="zoom_out", description="Zoom out"),
+    KeyboardShortcut(
+        key="key-open_tuner", action="open_tuner", description="Open tuner"
+    ),
+    KeyboardShortcut(
+        key="key-save_checkpoint", action="save_checkpoint", description="Save"
+    ),
+    KeyboardShortcut(
+        key="key-toggle_dual_view",
+        action="toggle_dual_view",
+        description="Toggle dual view",
+    ),
+    KeyboardShortcut(
+        key="key-reconcile_sync", action="reconcile_sync", description="Reconcile"
+    ),
+)
+_FULL_LABELS = (
+    "graph_canvas",
+    "branch_button",
+    "zoom_slider",
+    "tuner_panel",
+    "text_editor",
+    "image_panel",
+    "sync_badges",
+)
+_FULL_NONCOLOR = ("sync_icon", "warning_icon", "stale_badge")
 
-    def test_responsive_layout_tablet(self) -> None:
-        """Tablet layout has correct settings."""
-        manager = AccessibilityManager()
-        layout = manager.layout_for_width(900)
 
-        assert layout.breakpoint == "tablet"
-        assert layout.graph_columns == 2
+@pytest.fixture(scope="module")
+def accessibility_manager() -> AccessibilityManager:
+    return AccessibilityManager()
 
-    def test_responsive_layout_desktop(self) -> None:
-        """Desktop layout has correct settings."""
-        manager = AccessibilityManager()
-        layout = manager.layout_for_width(1400)
 
-        assert layout.breakpoint == "desktop"
-        assert layout.graph_columns == 3
-        assert layout.controls_stacked is False
+class TestG85AccessibilityMobileReadiness:
+    """G8.5: Accessibility and mobile readiness."""
 
-    def test_keyboard_navigation_arrows(self) -> None:
+    @pytest.mark.parametrize(
+        ("width", "breakpoint", "columns", "controls_stacked", "dual_view_stacked"),
+        [
+            (375, "mobile", 1, True, True),
+            (900, "tablet", 2, True, False),
+            (1400, "desktop", 3, False, False),
+        ],
+    )
+    def test_responsive_layout(
+        self,
+        accessibility_manager: AccessibilityManager,
+        width: int,
+        breakpoint: str,
+        columns: int,
+        controls_stacked: bool,
+        dual_view_stacked: bool,
+    ) -> None:
+        """Each breakpoint has the expected layout settings."""
+        layout = accessibility_manager.layout_for_width(width)
+
+        assert layout.breakpoint == breakpoint
+        assert layout.graph_columns == columns
+        assert layout.controls_stacked is controls_stacked
+        assert layout.dual_view_stacked is dual_view_stacked
+
+    def test_keyboard_navigation_arrows(
+        self, accessibility_manager: AccessibilityManager
+    ) -> None:
         """Arrow keys navigate items."""
-        manager = AccessibilityManager()
-
-        kb_next = manager.keyboard_next_index
+        kb_next = accessibility_manager.keyboard_next_index
         assert kb_next(current_index=0, key="arrowright", item_count=5) == 1
         assert kb_next(current_index=4, key="arrowright", item_count=5) == 0
         assert kb_next(current_index=1, key="arrowleft", item_count=5) == 0
 
-    def test_keyboard_navigation_home_end(self) -> None:
+    def test_keyboard_navigation_home_end(
+        self, accessibility_manager: AccessibilityManager
+    ) -> None:
         """Home/End keys jump to first/last."""
-        manager = AccessibilityManager()
-
-        kb_next = manager.keyboard_next_index
+        kb_next = accessibility_manager.keyboard_next_index
         assert kb_next(current_index=3, key="home", item_count=5) == 0
         assert kb_next(current_index=2, key="end", item_count=5) == 4
 
-    def test_accessibility_audit_coverage(self) -> None:
+    def test_accessibility_audit_coverage(
+        self, accessibility_manager: AccessibilityManager
+    ) -> None:
         """Audit measures keyboard and label coverage."""
-        manager = AccessibilityManager()
-
         shortcuts = (
             KeyboardShortcut(
                 key="ctrl+b", action="create_branch", description="Create branch"
@@ -386,7 +474,7 @@ class TestG85AccessibilityMobileReadiness:
             KeyboardShortcut(key="ctrl+z", action="undo", description="Undo"),
         )
 
-        audit = manager.audit(
+        audit = accessibility_manager.audit(
             shortcuts=shortcuts,
             semantic_labels=("graph_canvas", "branch_button"),
             non_color_indicators=("sync_icon",),
@@ -397,38 +485,14 @@ class TestG85AccessibilityMobileReadiness:
         assert 0.0 <= audit.semantic_label_coverage <= 1.0
         assert isinstance(audit.mobile_ready, bool)
 
-    def test_critical_flows_usable_threshold(self) -> None:
+    def test_critical_flows_usable_threshold(
+        self, accessibility_manager: AccessibilityManager
+    ) -> None:
         """Critical flows require 95% coverage."""
-        manager = AccessibilityManager()
-
-        # Full coverage
-        full_shortcuts = tuple(
-            KeyboardShortcut(key=f"key-{a}", action=a, description=d)
-            for a, d in [
-                ("create_branch", "Create branch"),
-                ("undo", "Undo"),
-                ("redo", "Redo"),
-                ("zoom_in", "Zoom in"),
-                ("zoom_out", "Zoom out"),
-                ("open_tuner", "Open tuner"),
-                ("save_checkpoint", "Save"),
-                ("toggle_dual_view", "Toggle dual view"),
-                ("reconcile_sync", "Reconcile"),
-            ]
-        )
-
-        audit = manager.audit(
-            shortcuts=full_shortcuts,
-            semantic_labels=(
-                "graph_canvas",
-                "branch_button",
-                "zoom_slider",
-                "tuner_panel",
-                "text_editor",
-                "image_panel",
-                "sync_badges",
-            ),
-            non_color_indicators=("sync_icon", "warning_icon", "stale_badge"),
+        audit = accessibility_manager.audit(
+            shortcuts=_FULL_SHORTCUTS,
+            semantic_labels=_FULL_LABELS,
+            non_color_indicators=_FULL_NONCOLOR,
             viewport_width=375,
         )
 
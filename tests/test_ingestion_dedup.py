@@ -5,12 +5,21 @@ from __future__ import annotations
 from pathlib import Path
 
 import agents.archivist as archivist
+import pytest
 
+from _image_fixtures import image_bytes
 
-def _create_png(path: Path, color: tuple[int, int, int]) -> None:
-    image_module = __import__("PIL.Image", fromlist=["Image"])
-    image = image_module.new("RGB", (320, 320), color)
-    image.save(path, format="PNG")
+_PAGE_COLOR = (120, 60, 30)
+_NEAR_DUPLICATE_COLOR = (122, 62, 28)
+
+
+@pytest.fixture(scope="session")
+def png_pages() -> dict[tuple[int, int, int], bytes]:
+    """PNG payloads per page color, encoded once per test session."""
+    return {
+        color: image_bytes(mode="RGB", size=(320, 320), image_format="PNG", color=color)
+        for color in (_PAGE_COLOR, _NEAR_DUPLICATE_COLOR)
+    }
 
 
 def test_text_reingestion_is_idempotent_with_cache(tmp_path: Path) -> None:
@@ -54,8 +63,10 @@ def test_text_near_duplicate_detection_uses_chunk_signatures(tmp_path: Path) ->
     )
 
 
-def test_manga_reingestion_is_idempotent_with_cache(tmp_path: Path) -> None:
-    _create_png(tmp_path / "page-1.png", (120, 60, 30))
+def test_manga_reingestion_is_idempotent_with_cache(
+    tmp_path: Path, png_pages: dict[tuple[int, int, int], bytes]
+) -> None:
+    (tmp_path / "page-1.png").write_bytes(png_pages[_PAGE_COLOR])
 
     cache = archivist.IngestionDedupeCache()
     first_report = archivist.ingest_image_folder_pages(
@@ -74,14 +85,16 @@ def test_manga_reingestion_is_idempotent_with_cache(tmp_path: Path) -> None:
     assert any("Source unchanged" in warning for warning in second_report.warnings)
 
 
-def test_manga_near_duplicate_detection_uses_perceptual_hash(tmp_path: Path) -> None:
+def test_manga_near_duplicate_detection_uses_perceptual_hash(
+    tmp_path: Path, png_pages: dict[tuple[int, int, int], bytes]
+) -> None:
     first_dir = tmp_path / "first"
     second_dir = tmp_path / "second"
     first_dir.mkdir()
     second_dir.mkdir()
 
-    _create_png(first_dir / "page-1.png", (120, 60, 30))
-    _create_png(second_dir / "page-1.png", (122, 62, 28))
+    (first_dir / "page-1.png").write_bytes(png_pages[_PAGE_COLOR])
+    (second_dir / "page-1.png").write_bytes(png_pages[_NEAR_DUPLICATE_COLOR])
 
     cache = archivist.IngestionDedupeCache()
     archivist.ingest_image_folder_pages(
@@ -3,27 +3,24 @@
 from __future__ import annotations
 
 import io
+import os
 from pathlib import Path
 from zipfile import ZIP_DEFLATED, ZipFile
 
 import agents.archivist as archivist
 import pytest
 
+from _image_fixtures import image_bytes
+
+_WHITE = (255, 255, 255)
+
 
 def _png_bytes() -> bytes:
-    image_module = __import__("PIL.Image", fromlist=["Image"])
-    image = image_module.new("RGB", (8, 8), "white")
-    payload = io.BytesIO()
-    image.save(payload, format="PNG")
-    return payload.getvalue()
+    return image_bytes(mode="RGB", size=(8, 8), image_format="PNG", color=_WHITE)
 
 
 def _jpeg_bytes() -> bytes:
-    image_module = __import__("PIL.Image", fromlist=["Image"])
-    image = image_module.new("RGB", (8, 8), "white")
-    payload = io.BytesIO()
-    image.save(payload, format="JPEG")
-    return payload.getvalue()
+    return image_bytes(mode="RGB", size=(8, 8), image_format="JPEG", color=_WHITE)
 
 
 def _write_fake_png(path: Path) -> None:
@@ -63,8 +60,14 @@ def test_image_folder_ingestion_uses_sandbox_by_default(
 
 
 def test_image_folder_ingestion_enforces_page_count_limit(tmp_path: Path) -> None:
-    for index in range(3):
-        _write_fake_png(tmp_path / f"page-{index}.png")
+    first_page = tmp_path / "page-0.png"
+    _write_fake_png(first_page)
+    for index in range(1, 3):
+        page = tmp_path / f"page-{index}.png"
+        if hasattr(os, "link"):
+            os.link(first_page, page)
+        else:
+            _write_fake_png(page)
 
     policy = archivist.IngestionPolicy(max_page_count=2)
     with pytest.raises(
@@ -94,7 +97,7 @@ def test_cbz_ingestion_rejects_path_traversal(tmp_path: Path) -> None:
 def test_cbz_ingestion_rejects_compression_ratio_abuse(tmp_path: Path) -> None:
     archive_path = tmp_path / "ratio.cbz"
     with ZipFile(archive_path, "w", compression=ZIP_DEFLATED) as cbz_archive:
-        cbz_archive.writestr("page-1.png", _png_bytes() + (b"A" * 40_000))
+        cbz_archive.writestr("page-1.png", _png_bytes() + (b"A" * 2_000))
 
     strict_policy = archivist.IngestionPolicy(max_compression_ratio=2.0)
     with pytest.raises(archivist.IngestionSecurityError, match="compression ratio"):
@@ -113,10 +116,27 @@ def test_cbz_ingestion_rejects_signature_mismatch(tmp_path: Path) -> None:
         archivist.ingest_cbz_pages(archive_path, use_sandbox=False)
 
 
-def test_cbz_ingestion_enforces_worker_timeout(tmp_path: Path) -> None:
-    archive_path = tmp_path / "pages.cbz"
-    with ZipFile(archive_path, "w", compression=ZIP_DEFLATED) as cbz_archive:
+@pytest.fixture(scope="session")
+def minimal_cbz_bytes() -> bytes:
+    """A valid single-page CBZ archive, built once per test session."""
+    payload = io.BytesIO()
+    with ZipFile(payload, "w", compression=ZIP_DEFLATED) as cbz_archive:
         cbz_archive.writestr("page-1.png", _png_bytes())
+    return payload.getvalue()
+
+
+def test_cbz_ingestion_enforces_worker_timeout(
+    tmp_path: Path,
+    minimal_cbz_bytes: bytes,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    archive_path = tmp_path / "pages.cbz"
+    archive_path.write_bytes(minimal_cbz_bytes)
+
+    def fail_spawn(method: str) -> None:
+        raise AssertionError(f"unexpected {method} worker for a zero timeout")
+
+    monkeypatch.setattr(archivist, "get_context", fail_spawn)
 
     short_timeout_policy = archivist.IngestionPolicy(worker_timeout_seconds=0.0)
     with pytest.raises(TimeoutError, match="exceeded timeout"):
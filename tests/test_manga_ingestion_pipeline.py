@@ -2,28 +2,21 @@
 
 from __future__ import annotations
 
-import io
+import hashlib
 from pathlib import Path
 from zipfile import ZIP_DEFLATED, ZipFile
 
 import agents.archivist as archivist
+import pytest
+
+from _image_fixtures import image_bytes
 
 
 def _save_image(
     path: Path, *, mode: str, size: tuple[int, int], image_format: str
 ) -> None:
-    image_module = __import__("PIL.Image", fromlist=["Image"])
-    image = image_module.new(mode, size, (255, 0, 0, 180) if "A" in mode else 120)
     path.parent.mkdir(parents=True, exist_ok=True)
-    image.save(path, format=image_format)
-
-
-def _image_bytes(*, mode: str, size: tuple[int, int], image_format: str) -> bytes:
-    image_module = __import__("PIL.Image", fromlist=["Image"])
-    image = image_module.new(mode, size, (255, 0, 0, 180) if "A" in mode else 120)
-    payload = io.BytesIO()
-    image.save(payload, format=image_format)
-    return payload.getvalue()
+    path.write_bytes(image_bytes(mode=mode, size=size, image_format=image_format))
 
 
 def test_folder_ingestion_normalizes_modes_and_detects_spreads(tmp_path: Path) -> None:
@@ -52,10 +45,10 @@ def test_cbz_ingestion_collects_metadata_and_spread_count(tmp_path: Path) -> Non
     archive_path = tmp_path / "panels.cbz"
     with ZipFile(archive_path, "w", compression=ZIP_DEFLATED) as cbz_archive:
         cbz_archive.writestr(
-            "01.png", _image_bytes(mode="RGB", size=(300, 500), image_format="PNG")
+            "01.png", image_bytes(mode="RGB", size=(300, 500), image_format="PNG")
         )
         cbz_archive.writestr(
-            "02.png", _image_bytes(mode="RGBA", size=(900, 400), image_format="PNG")
+            "02.png", image_bytes(mode="RGBA", size=(900, 400), image_format="PNG")
         )
 
     report = archivist.ingest_cbz_pages(
@@ -89,3 +82,68 @@ def test_folder_ingestion_supports_png_jpg_jpeg_webp(tmp_path: Path) -> None:
 
     assert report.page_count == 4
     assert set(report.page_formats) == {"jpeg", "png", "webp"}
+
+
+def test_folder_ingestion_parallel_analysis_matches_sequential(tmp_path: Path) -> None:
+    for index in range(1, 5):
+        _save_image(
+            tmp_path / f"page-{index}.png",
+            mode="RGB",
+            size=(300 + index * 100, 400),
+            image_format="PNG",
+        )
+
+    sequential = archivist.ingest_image_folder_pages(
+        tmp_path, use_sandbox=False, idempotent=False
+    )
+    parallel = archivist.ingest_image_folder_pages(
+        tmp_path,
+        archivist.IngestionPolicy(page_analysis_workers=2),
+        use_sandbox=False,
+        idempotent=False,
+    )
+
+    assert parallel.page_metadata == sequential.page_metadata
+    assert parallel.spread_count == sequential.spread_count == 2
+
+
+def test_folder_ingestion_parallel_analysis_times_out(tmp_path: Path) -> None:
+    for index in range(1, 9):
+        _save_image(
+            tmp_path / f"page-{index}.png",
+            mode="RGB",
+            size=(300, 400),
+            image_format="PNG",
+        )
+
+    # Spawning the pool alone outlasts this budget, so the first result is late.
+    policy = archivist.IngestionPolicy(
+        page_analysis_workers=2, worker_timeout_seconds=0.001
+    )
+    with pytest.raises(TimeoutError):
+        archivist.ingest_image_folder_pages(
+            tmp_path, policy, use_sandbox=False, idempotent=False
+        )
+
+
+def test_folder_ingestion_hash_algorithm_follows_policy(tmp_path: Path) -> None:
+    _save_image(
+        tmp_path / "page-1.png", mode="RGB", size=(300, 400), image_format="PNG"
+    )
+    page_bytes = (tmp_path / "page-1.png").read_bytes()
+
+    default_report = archivist.ingest_image_folder_pages(
+        tmp_path, use_sandbox=False, idempotent=False
+    )
+    blake_report = archivist.ingest_image_folder_pages(
+        tmp_path,
+        archivist.IngestionPolicy(hash_algorithm="blake2b"),
+        use_sandbox=False,
+        idempotent=False,
+    )
+
+    default_page = default_report.page_metadata[0]
+    assert default_page.content_hash == hashlib.sha256(page_bytes).hexdigest()
+    blake_page = blake_report.page_metadata[0]
+    assert blake_page.content_hash == hashlib.blake2b(page_bytes).hexdigest()
+    assert blake_report.source_hash != default_report.source_hash
@@ -0,0 +1,115 @@
+"""Tests for SQLite-backed manga volume storage."""
+
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import replace
+from pathlib import Path
+
+from core.manga_storage import MangaPage, MangaStorage, MangaVolume
+
+
+def _volume(volume_id: str = "manga_test") -> MangaVolume:
+    return MangaVolume(
+        volume_id=volume_id,
+        title="Test Volume",
+        source_path="/tmp/test-volume",
+        page_count=5,
+        source_hash="abc123",
+    )
+
+
+def _pages(count: int) -> list[MangaPage]:
+    return [
+        MangaPage(
+            page_number=index,
+            format_name="png",
+            width=300,
+            height=400,
+            content_hash=f"hash-{index}",
+            ocr_text=f"text {index}",
+        )
+        for index in range(1, count + 1)
+    ]
+
+
+def test_save_volume_round_trips_pages(tmp_path: Path) -> None:
+    storage = MangaStorage(str(tmp_path / "manga.db"))
+    volume = replace(_volume(), pages=tuple(_pages(3)))
+
+    assert storage.save_volume(volume)
+
+    loaded = storage.get_volume("manga_test")
+    assert loaded is not None
+    assert loaded.pages == tuple(_pages(3))
+    assert storage.get_volume_by_hash("abc123") == loaded
+
+
+def test_save_volume_streaming_consumes_lazy_pages_in_chunks(tmp_path: Path) -> None:
+    storage = MangaStorage(str(tmp_path / "manga.db"))
+    pages = iter(_pages(5))
+
+    assert storage.save_volume_streaming(_volume(), pages, chunk_size=2)
+
+    loaded = storage.get_volume("manga_test")
+    assert loaded is not None
+    assert [page.page_number for page in loaded.pages] == [1, 2, 3, 4, 5]
+    assert next(pages, None) is None
+
+
+def test_get_volume_by_listing_fingerprint_finds_saved_volume(tmp_path: Path) -> None:
+    storage = MangaStorage(str(tmp_path / "manga.db"))
+    volume = replace(_volume(), listing_fingerprint="fp-1")
+    assert storage.save_volume(volume)
+
+    found = storage.get_volume_by_listing_fingerprint("fp-1")
+
+    assert found is not None
+    assert found.volume_id == "manga_test"
+    assert found.listing_fingerprint == "fp-1"
+    assert storage.get_volume_by_listing_fingerprint("fp-2") is None
+    assert storage.get_volume_by_listing_fingerprint("") is None
+
+
+def test_storage_migrates_volumes_table_without_listing_fingerprint(
+    tmp_path: Path,
+) -> None:
+    db_path = tmp_path / "manga.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE manga_volumes (
+            volume_id TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            source_path TEXT NOT NULL,
+            page_count INTEGER NOT NULL,
+            source_hash TEXT NOT NULL,
+            graph_node_id TEXT,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+    """)
+    conn.execute(
+        "INSERT INTO manga_volumes VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        ("legacy", "Legacy", "/tmp/legacy", 0, "h", None, "t0", "t0"),
+    )
+    conn.commit()
+    conn.close()
+
+    storage = MangaStorage(str(db_path))
+
+    legacy = storage.get_volume("legacy")
+    assert legacy is not None
+    assert legacy.listing_fingerprint == ""
+
+
+def test_save_volume_streaming_spans_multiple_multi_row_statements(
+    tmp_path: Path,
+) -> None:
+    storage = MangaStorage(str(tmp_path / "manga.db"))
+
+    assert storage.save_volume_streaming(_volume(), _pages(300))
+
+    loaded = storage.get_volume("manga_test")
+    assert loaded is not None
+    assert len(loaded.pages) == 300
+    assert loaded.pages[-1].content_hash == "hash-300"
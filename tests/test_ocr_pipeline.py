@@ -8,16 +8,20 @@ from pathlib import Path
 import agents.archivist as archivist
 import pytest
 
+from _image_fixtures import Image
 
-def _create_test_image(path: Path) -> None:
-    image_module = __import__("PIL.Image", fromlist=["Image"])
-    image = image_module.new("RGB", (320, 180), "white")
-    image.save(path, format="PNG")
+# 320x180 all-white 1-bit PNG; the OCR tests only need a valid page header.
+_BLANK_PAGE_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000140000000b40100000000cd9fc8bc"
+    "000000324944415478daedcaa10100000803a0e9ff3feb0b2613646a72d3114551"
+    "1445511445511445511445511445511445511445517c8f0b1af002677ced292d00"
+    "00000049454e44ae426082"
+)
 
 
 def test_sidecar_ocr_fallback_extracts_regions(tmp_path: Path) -> None:
     page_path = tmp_path / "panel.png"
-    _create_test_image(page_path)
+    page_path.write_bytes(_BLANK_PAGE_PNG)
 
     sidecar_path = page_path.with_suffix(f"{page_path.suffix}.ocr.txt")
     sidecar_path.write_text(
@@ -36,31 +40,33 @@ def test_sidecar_ocr_fallback_extracts_regions(tmp_path: Path) -> None:
     assert report.regions[0].confidence == pytest.approx(0.92)
 
 
+# Shared primary-OCR stub; the pipeline only reads the returned regions.
+_LOW_CONFIDENCE_PRIMARY = [
+    archivist.OcrRegion(
+        x1=0,
+        y1=0,
+        x2=40,
+        y2=20,
+        text="primary",
+        confidence=0.2,
+        region_type="speech",
+    )
+]
+
+
 def test_ocr_ensemble_prefers_higher_confidence_fallback(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     page_path = tmp_path / "panel.png"
-    _create_test_image(page_path)
+    page_path.write_bytes(_BLANK_PAGE_PNG)
     page_path.with_suffix(f"{page_path.suffix}.ocr.txt").write_text(
         "0,0,100,80|0.95|Narration: fallback text",
         encoding="utf-8",
     )
 
     monkeypatch.setattr(
-        archivist,
-        "_run_primary_ocr_regions",
-        lambda _path: [
-            archivist.OcrRegion(
-                x1=0,
-                y1=0,
-                x2=40,
-                y2=20,
-                text="primary",
-                confidence=0.2,
-                region_type="speech",
-            )
-        ],
+        archivist, "_run_primary_ocr_regions", lambda _path: _LOW_CONFIDENCE_PRIMARY
     )
 
     report = archivist.extract_ocr_from_manga_page(page_path, min_confidence=0.6)
@@ -71,7 +77,7 @@ def test_ocr_ensemble_prefers_higher_confidence_fallback(
 
 def test_ocr_report_serialization_includes_coordinates(tmp_path: Path) -> None:
     page_path = tmp_path / "panel.png"
-    _create_test_image(page_path)
+    page_path.write_bytes(_BLANK_PAGE_PNG)
     page_path.with_suffix(f"{page_path.suffix}.ocr.txt").write_text(
         "5,6,40,50|0.8|(I should run)",
         encoding="utf-8",
@@ -88,3 +94,218 @@ def test_ocr_report_serialization_includes_coordinates(tmp_path: Path) -> None:
     assert region_payload["y2"] == 50
     assert region_payload["confidence"] == pytest.approx(0.8)
     assert region_payload["region_type"] == "thought"
+
+
+def test_ocr_report_serialization_matches_without_orjson(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    page_path = tmp_path / "panel.png"
+    page_path.write_bytes(_BLANK_PAGE_PNG)
+    page_path.with_suffix(f"{page_path.suffix}.ocr.txt").write_text(
+        "5,6,40,50|0.8|Narrator: café au lait",
+        encoding="utf-8",
+    )
+    reports = archivist.extract_ocr_for_manga_pages([page_path])
+
+    default_path = tmp_path / "default.json"
+    archivist.save_ocr_reports(reports, default_path)
+    monkeypatch.setattr(archivist, "_load_orjson_module", lambda: None)
+    stdlib_path = tmp_path / "stdlib.json"
+    archivist.save_ocr_reports(reports, stdlib_path)
+
+    assert json.loads(stdlib_path.read_bytes()) == json.loads(default_path.read_bytes())
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_ocr_reports_ndjson_appends_one_line_per_page(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    use_orjson: bool,
+) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(archivist, "_load_orjson_module", lambda: None)
+    page_paths = []
+    for index in range(3):
+        page_path = tmp_path / f"page-{index}.png"
+        page_path.write_bytes(_BLANK_PAGE_PNG)
+        page_path.with_suffix(f"{page_path.suffix}.ocr.txt").write_text(
+            f"1,2,30,40|0.7|Line {index}", encoding="utf-8"
+        )
+        page_paths.append(page_path)
+    reports = archivist.extract_ocr_for_manga_pages(page_paths)
+    output_path = tmp_path / "reports" / "ocr.ndjson"
+
+    archivist.save_ocr_reports_ndjson(reports[:2], output_path)
+    archivist.save_ocr_reports_ndjson(reports[2:], output_path)
+
+    lines = output_path.read_bytes().splitlines()
+    pages = [json.loads(line) for line in lines]
+    assert len(lines) == 3
+    assert [page["source_path"] for page in pages] == [str(p) for p in page_paths]
+    assert pages[2]["regions"][0]["text"] == "Line 2"
+    assert pages[0]["regions"][0]["x2"] == 30
+
+
+@pytest.mark.parametrize(
+    ("file_name", "image_format", "save_kwargs", "oriented"),
+    [
+        ("panel.png", "PNG", {}, False),
+        ("panel-oriented.png", "PNG", {}, True),
+        ("panel.webp", "WEBP", {}, False),
+        ("panel-lossless.webp", "WEBP", {"lossless": True}, False),
+        ("panel.jpg", "JPEG", {}, True),
+    ],
+)
+def test_sidecar_plain_line_spans_oriented_page(
+    tmp_path: Path,
+    file_name: str,
+    image_format: str,
+    save_kwargs: dict[str, object],
+    oriented: bool,
+) -> None:
+    image = Image.new("RGB", (320, 180), "white")
+    exif = image.getexif()
+    if oriented:
+        exif[0x0112] = 6  # rotated 90 degrees; displayed as 180x320
+    page_path = tmp_path / file_name
+    image.save(page_path, format=image_format, exif=exif, **save_kwargs)
+    page_path.with_suffix(f"{page_path.suffix}.ocr.txt").write_text(
+        "Unstructured caption", encoding="utf-8"
+    )
+
+    (region,) = archivist._parse_sidecar_ocr_regions(page_path)
+
+    expected_size = (180, 320) if oriented else (320, 180)
+    assert (region.x2, region.y2) == expected_size
+
+
+@pytest.mark.parametrize(
+    ("file_name", "page_bytes"),
+    [
+        ("truncated.png", _BLANK_PAGE_PNG[:20]),
+        ("truncated.webp", b"RIFF\x00\x00\x00\x00WEBPVP8X"),
+    ],
+)
+def test_sidecar_plain_line_rejects_truncated_page(
+    tmp_path: Path, file_name: str, page_bytes: bytes
+) -> None:
+    page_path = tmp_path / file_name
+    page_path.write_bytes(page_bytes)
+    page_path.with_suffix(f"{page_path.suffix}.ocr.txt").write_text(
+        "Unstructured caption", encoding="utf-8"
+    )
+
+    with pytest.raises(OSError):
+        archivist._parse_sidecar_ocr_regions(page_path)
+
+
+def test_structured_sidecar_does_not_probe_page_image(tmp_path: Path) -> None:
+    page_path = tmp_path / "missing.png"
+    page_path.with_suffix(f"{page_path.suffix}.ocr.txt").write_text(
+        " 1, 2 ,30,40 | .5 | Who is there? \n-3,+4,5,6|1e-1|a|b\n",
+        encoding="utf-8",
+    )
+
+    regions = archivist._parse_sidecar_ocr_regions(page_path)
+
+    assert [(r.x1, r.y1, r.x2, r.y2) for r in regions] == [
+        (1, 2, 30, 40),
+        (-3, 4, 5, 6),
+    ]
+    assert [r.text for r in regions] == ["Who is there?", "a|b"]
+    assert regions[0].confidence == pytest.approx(0.5)
+    assert regions[1].confidence == pytest.approx(0.1)
+
+
+def test_structured_sidecar_accepts_unicode_whitespace(tmp_path: Path) -> None:
+    page_path = tmp_path / "missing.png"
+    page_path.with_suffix(f"{page_path.suffix}.ocr.txt").write_text(
+        "　1,2,3,4|0.9|hello\n5,\xa06,7,8 |0.4|　bye　\n",
+        encoding="utf-8",
+    )
+
+    regions = archivist._parse_sidecar_ocr_regions(page_path)
+
+    assert [(r.x1, r.y1, r.x2, r.y2) for r in regions] == [
+        (1, 2, 3, 4),
+        (5, 6, 7, 8),
+    ]
+    assert [r.text for r in regions] == ["hello", "bye"]
+    assert regions[0].confidence == pytest.approx(0.9)
+
+
+def test_batch_ocr_preserves_page_order(tmp_path: Path) -> None:
+    page_paths = []
+    for index in range(6):
+        page_path = tmp_path / f"page-{index}.png"
+        page_path.write_bytes(_BLANK_PAGE_PNG)
+        page_path.with_suffix(f"{page_path.suffix}.ocr.txt").write_text(
+            f"0,0,10,10|0.9|Line {index}", encoding="utf-8"
+        )
+        page_paths.append(page_path)
+
+    threaded = archivist.extract_ocr_for_manga_pages(page_paths)
+    sequential = archivist.extract_ocr_for_manga_pages(page_paths, max_workers=1)
+
+    assert [report.source_path for report in threaded] == page_paths
+    assert [report.regions[0].text for report in threaded] == [
+        f"Line {index}" for index in range(6)
+    ]
+    assert threaded == sequential
+
+
+def test_batch_ocr_groups_primary_calls(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    page_paths = [tmp_path / f"page-{index}.png" for index in range(5)]
+    for page_path in page_paths:
+        page_path.write_bytes(_BLANK_PAGE_PNG)
+
+    batch_sizes: list[int] = []
+
+    def fake_batch(
+        image_paths: list[Path],
+    ) -> list[list[archivist.OcrRegion] | Exception]:
+        batch_sizes.append(len(image_paths))
+        return [
+            [archivist.OcrRegion(0, 0, 8, 8, path.stem, 0.9, "speech")]
+            for path in image_paths
+        ]
+
+    monkeypatch.setattr(archivist, "_run_primary_ocr_regions_batch", fake_batch)
+
+    reports = archivist.extract_ocr_for_manga_pages(
+        page_paths, max_workers=1, batch_size=2
+    )
+
+    assert batch_sizes == [2, 2, 1]
+    assert [report.regions[0].text for report in reports] == [
+        path.stem for path in page_paths
+    ]
+    assert {report.engine for report in reports} == {"pytesseract"}
+
+
+def test_mapped_sidecar_matches_buffered_parse(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    page_path = tmp_path / "panel.png"
+    page_path.write_bytes(_BLANK_PAGE_PNG)
+    page_path.with_suffix(f"{page_path.suffix}.ocr.txt").write_bytes(
+        "1,2,3,4|0.9|Narrator: one\r\n\r\nloose caption\r(thought)\n"
+        "5,6,7,8|0.4|「台詞」".encode()
+    )
+
+    buffered = archivist._parse_sidecar_ocr_regions(page_path)
+    monkeypatch.setattr(archivist, "_SIDECAR_MMAP_MIN_BYTES", 1)
+    mapped = archivist._parse_sidecar_ocr_regions(page_path)
+
+    assert mapped == buffered
+    assert [region.text for region in mapped] == [
+        "Narrator: one",
+        "loose caption",
+        "(thought)",
+        "「台詞」",
+    ]
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime, timedelta
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta, tzinfo
 
+import pytest
+from core import operations_engine
 from core.operations_engine import (
     CapacityManager,
     ComplianceManager,
@@ -16,6 +19,7 @@ from core.operations_engine import (
     Phase9Metrics,
     PrivacyManager,
     QueuePriority,
+    correlation_scope,
 )
 
 
@@ -72,6 +76,21 @@ class TestG91ObservabilityAndSLOs:
         assert child_span.trace_id == root_span.trace_id
         assert child_span.parent_span_id == root_span.span_id
 
+    def test_span_with_unknown_parent_starts_new_trace(self) -> None:
+        """A parent that is not active does not leak a trace ID."""
+        manager = ObservabilityManager()
+        root = manager.start_span("root", Component.RETRIEVAL)
+        manager.end_span(root.span_id)
+
+        orphan = manager.start_span(
+            "late_child", Component.RETRIEVAL, parent_span_id=root.span_id
+        )
+
+        assert orphan.parent_span_id == root.span_id
+        assert orphan.trace_id != root.trace_id
+        assert len(orphan.span_id) == len(orphan.trace_id) == 16
+        int(orphan.span_id, 16)
+
     def test_span_end_creates_complete_trace(self) -> None:
         """Ending a span creates complete trace record."""
         manager = ObservabilityManager()
@@ -87,6 +106,30 @@ class TestG91ObservabilityAndSLOs:
         assert ended.status == "ok"
         assert len(manager._spans) == 1
 
+    def test_span_history_is_bounded(self) -> None:
+        """Completed spans are kept in a fixed-size history."""
+        manager = ObservabilityManager(span_history=3)
+        for i in range(5):
+            span = manager.start_span(f"op-{i}", Component.GENERATION)
+            manager.end_span(span.span_id)
+
+        assert [span.operation for span in manager._spans] == ["op-2", "op-3", "op-4"]
+
+        outer = manager.start_span("outer", Component.GENERATION)
+        inner = manager.start_span(
+            "generation.render_image",
+            Component.GENERATION,
+            parent_span_id=outer.span_id,
+        )
+        entry = manager.log(LogLevel.INFO, Component.GENERATION, "In inner span")
+        manager.end_span(inner.span_id)
+
+        assert entry.span_id == inner.span_id
+        result = IncidentManager().replay_scenario(
+            "scn-model-oom", manager._logs, manager._spans
+        )
+        assert result["matched_spans"] == 1
+
     def test_slo_default_definitions_exist(self) -> None:
         """Default SLOs defined for latency, failure rate, sync success."""
         manager = ObservabilityManager()
@@ -112,6 +155,24 @@ class TestG91ObservabilityAndSLOs:
         assert measurement.measured_value > 0
         assert measurement.is_breached is False  # Should be under 5000ms
 
+    def test_slo_p95_tracks_window_eviction(self) -> None:
+        """P95 stays exact as samples age out of the SLO window."""
+        manager = ObservabilityManager()
+        stale = (datetime.now(UTC) - timedelta(hours=2)).isoformat()
+        # Backdate an outlier sample (hack for testing)
+        manager._latency_samples["ingestion_latency"].append((stale, 99999.0))
+        manager._sorted_latencies["ingestion_latency"].append(99999.0)
+
+        for i in range(100):
+            manager.record_latency("ingestion_latency", float(i * 10))
+
+        measurement = manager.measure_slo("ingestion_latency")
+
+        assert measurement is not None
+        assert measurement.sample_count == 100
+        assert measurement.measured_value == 950.0
+        assert measurement.window_start > stale
+
     def test_slo_breach_detection(self) -> None:
         """SLO breach detected when threshold exceeded."""
         manager = ObservabilityManager()
@@ -151,6 +212,58 @@ class TestG91ObservabilityAndSLOs:
         assert len(logs) == 1
         assert logs[0].message == "Message 1"
 
+    def test_correlation_scope_tags_logs(self) -> None:
+        """Logs inside a correlation scope share its ID unless given one."""
+        manager = ObservabilityManager()
+
+        with correlation_scope("req-scope") as scoped_id:
+            inner = manager.log(LogLevel.INFO, Component.RETRIEVAL, "Inner")
+            explicit = manager.log(
+                LogLevel.INFO, Component.RETRIEVAL, "Explicit", job_id="job-1"
+            )
+        outer = manager.log(LogLevel.INFO, Component.RETRIEVAL, "Outer")
+
+        assert scoped_id == "req-scope"
+        assert inner.correlation_id == "req-scope"
+        assert explicit.correlation_id == "job-1"
+        assert outer.correlation_id not in {"req-scope", None}
+        assert manager.query_logs(correlation_id="req-scope") == [inner]
+
+    def test_log_query_combines_indexed_filters(self) -> None:
+        """Level and correlation filters intersect, in emission order."""
+        manager = ObservabilityManager()
+        for i in range(6):
+            manager.log(
+                LogLevel.ERROR if i % 2 else LogLevel.INFO,
+                Component.RETRIEVAL if i < 3 else Component.GENERATION,
+                f"Message {i}",
+                request_id="req-abc" if i % 3 else "req-xyz",
+            )
+
+        logs = manager.query_logs(level=LogLevel.ERROR, correlation_id="req-abc")
+        assert [e.message for e in logs] == ["Message 1", "Message 5"]
+
+        logs = manager.query_logs(
+            level=LogLevel.ERROR,
+            component=Component.GENERATION,
+            correlation_id="req-abc",
+        )
+        assert [e.message for e in logs] == ["Message 5"]
+        assert manager.query_logs(correlation_id="req-missing") == []
+
+    def test_log_indexes_built_only_for_queried_fields(self) -> None:
+        """Logging maintains no index until a query filters on that field."""
+        manager = ObservabilityManager()
+        manager.log(LogLevel.INFO, Component.INGESTION, "Before", request_id="r1")
+        assert manager._log_indexes == {}
+
+        manager.query_logs(level=LogLevel.INFO)
+        manager.log(LogLevel.INFO, Component.INGESTION, "After", request_id="r2")
+
+        assert set(manager._log_indexes) == {"level"}
+        logs = manager.query_logs(level=LogLevel.INFO)
+        assert [e.message for e in logs] == ["Before", "After"]
+
 
 class TestG92IncidentReadiness:
     """G9.2: Incident readiness."""
@@ -187,6 +300,23 @@ class TestG92IncidentReadiness:
         assert matched is not None
         assert matched.category == "parser"
 
+    def test_runbook_symptom_matching_prefers_first_runbook(self) -> None:
+        """The first runbook with a symptom containing any input wins."""
+        manager = IncidentManager()
+
+        expected = {
+            ("unresponsive",): "model",
+            ("dead letter", "spike"): "parser",
+            ("queue",): "model",
+        }
+        for symptoms, category in expected.items():
+            matched = manager.match_runbook(list(symptoms))
+            assert matched is not None
+            assert matched.category == category
+        assert manager.match_runbook(["Queue"]) is None
+        assert manager.match_runbook(["stuck\0Generation"]) is None
+        assert manager.match_runbook([]) is None
+
     def test_incident_scenario_replay(self) -> None:
         """Incident scenarios can be replayed against logs."""
         manager = IncidentManager()
@@ -209,6 +339,25 @@ class TestG92IncidentReadiness:
         assert result["matched_logs"] > 0
         assert result["detection_rate"] >= 0.0
 
+    def test_incident_scenario_replay_rescans_reused_buffers(self) -> None:
+        """Replays reflect the current contents of a reused log buffer."""
+        manager = IncidentManager()
+        observability = ObservabilityManager()
+        error = observability.log(
+            LogLevel.ERROR, Component.INGESTION, "pdf parser timeout"
+        )
+        ok = observability.log(LogLevel.INFO, Component.INGESTION, "ingested")
+        buffer = [error]
+
+        first = manager.replay_scenario("scn-parser-pdf", buffer, [])
+        buffer[:] = [ok, ok]
+        second = manager.replay_scenario("scn-parser-pdf", buffer, [])
+
+        assert first["matched_logs"] == 1
+        assert first["detected_symptoms"] == ["Parser timeout"]
+        assert second["matched_logs"] == 0
+        assert second["detected_symptoms"] == []
+
     def test_postmortem_creation(self) -> None:
         """Postmortems can be created with timeline and action items."""
         manager = IncidentManager()
@@ -316,6 +465,21 @@ class TestG93CapacityAndCostManagement:
         assert check["exceeded"] == ["tokens"]
         assert check["target_id"] == "job-123"
 
+    def test_budget_sweep_reports_only_exceeded(self) -> None:
+        """A budget sweep matches the per-budget exceeded categories."""
+        manager = CapacityManager()
+        over = manager.create_budget(
+            "job-1", "job", max_tokens=100, max_cost_usd=1.0, max_images=5
+        )
+        under = manager.create_budget("job-2", "job", max_tokens=100)
+        manager.record_usage(over.budget_id, tokens=150, cost_usd=2.0, images=5)
+        manager.record_usage(under.budget_id, tokens=100)
+
+        sweep = manager.check_all_budgets()
+
+        assert sweep == {over.budget_id: ["tokens", "cost"]}
+        assert sweep[over.budget_id] == manager.check_budget(over.budget_id)["exceeded"]
+
     def test_kill_switch_triggering(self) -> None:
         """Kill switches can be triggered for emergency stop."""
         manager = CapacityManager()
@@ -356,6 +520,21 @@ class TestG93CapacityAndCostManagement:
         assert bg_allowed is False
         assert normal_allowed is True
 
+    def test_kill_switches_combine_component_and_priority(self) -> None:
+        """Component and background switches block independently."""
+        manager = CapacityManager()
+        manager.trigger_kill_switch("kill-ingestion", "admin", "Emergency")
+        manager.trigger_kill_switch("kill-background", "admin", "Overload")
+
+        assert not manager.is_operation_allowed("ingestion", QueuePriority.HIGH)
+        assert not manager.is_operation_allowed("branch", QueuePriority.BACKGROUND)
+        assert manager.is_operation_allowed("branch", QueuePriority.INTERACTIVE)
+
+        manager.reset_kill_switch("kill-background", "admin")
+
+        assert manager.is_operation_allowed("branch", QueuePriority.BACKGROUND)
+        assert not manager.is_operation_allowed("ingestion", QueuePriority.BACKGROUND)
+
     def test_kill_switch_reset(self) -> None:
         """Kill switches can be reset after incident."""
         manager = CapacityManager()
@@ -406,6 +585,20 @@ class TestG94PrivacyAndRetentionControls:
         assert "john@example.com" not in redacted
         assert "555-123-4567" not in redacted
 
+    def test_pii_redaction_batch_matches_single(self) -> None:
+        """Batch redaction matches redacting each text on its own."""
+        manager = PrivacyManager()
+        texts = [
+            "Contact john@example.com or call 555-123-4567",
+            "SSN 123-45-6789 from 10.0.0.1",
+            "nothing sensitive here",
+        ]
+
+        assert manager.redact_many(texts) == [manager.redact_pii(t) for t in texts]
+
+        manager.update_policy(pii_redaction_enabled=False)
+        assert manager.redact_many(iter(texts)) == texts
+
     def test_data_retention_record_creation(self) -> None:
         """Data retention records track expiration dates."""
         manager = PrivacyManager()
@@ -468,6 +661,28 @@ class TestG94PrivacyAndRetentionControls:
         assert result["redacted"] == 1
         assert manager._retention_records[0].is_redacted is True
 
+    def test_retention_enforcement_only_touches_expired(self) -> None:
+        """Enforcement redacts expired records and leaves live ones alone."""
+        manager = PrivacyManager()
+        expired_time = (datetime.now(UTC) - timedelta(days=1)).isoformat()
+        for i in range(4):
+            record = manager.create_retention_record(
+                data_type="temp", data_id=f"temp-{i}", retention_days=30
+            )
+            if i % 2:
+                manager._retention_records[i] = replace(record, expires_at=expired_time)
+
+        assert manager.enforce_retention() == {"expired_records": 2, "redacted": 2}
+        assert [r.is_redacted for r in manager._retention_records] == [
+            False,
+            True,
+            False,
+            True,
+        ]
+        assert manager.enforce_retention() == {"expired_records": 2, "redacted": 0}
+        assert manager.redact_record("ret-missing") is None
+        assert manager.redact_record("ret-0001") is not None
+
 
 class TestG95LegalAndLicenseCompliance:
     """G9.5: Legal and license compliance."""
@@ -518,6 +733,49 @@ class TestG95LegalAndLicenseCompliance:
         not_found = manager.verify_source_rights("nonexistent")
         assert not_found is None
 
+    def test_attestation_verification_keeps_first_for_hash(self) -> None:
+        """Re-attesting identical content does not shadow the original."""
+        manager = ComplianceManager()
+        attestations = [
+            manager.attest_source_rights(
+                source_path=f"/stories/copy-{i}.pdf",
+                source_content="same content",
+                has_distribution_rights=True,
+                has_derivative_rights=False,
+                license_type="proprietary",
+                attribution_required=False,
+            )
+            for i in range(2)
+        ]
+
+        assert attestations[0].source_hash == attestations[1].source_hash
+        verified = manager.verify_source_rights(attestations[0].source_hash)
+        assert verified == attestations[0]
+
+    def test_attestation_hash_with_blake3(self) -> None:
+        """The optional blake3 backend produces a verifiable source hash."""
+        blake3 = pytest.importorskip("blake3")
+        manager = ComplianceManager(hash_algorithm="blake3")
+
+        attestation = manager.attest_source_rights(
+            source_path="/stories/book.pdf",
+            source_content="unique content",
+            has_distribution_rights=True,
+            has_derivative_rights=False,
+            license_type="proprietary",
+            attribution_required=False,
+        )
+
+        expected = blake3.blake3(b"unique content").hexdigest()[:16]
+        assert attestation.source_hash == expected
+        assert manager.verify_source_rights(expected) == attestation
+
+    @pytest.mark.parametrize("hash_algorithm", ["no-such-hash", "shake_128"])
+    def test_unsupported_hash_algorithm_rejected(self, hash_algorithm: str) -> None:
+        """Unknown or variable-length hash algorithms fail at construction."""
+        with pytest.raises(ValueError, match=hash_algorithm):
+            ComplianceManager(hash_algorithm=hash_algorithm)
+
     def test_model_license_registration(self) -> None:
         """Model/checkpoint/adapter licenses registered."""
         manager = ComplianceManager()
@@ -677,6 +935,36 @@ class TestG96MatureContentGovernance:
         assert result["allowed"] is False
         assert "Blocked label detected: violence" in result["violations"]
 
+    def test_replaced_profile_rules_apply_to_later_checks(self) -> None:
+        """Setting a profile replaces the rules used for its id."""
+        manager = ContentGovernanceManager()
+        manager.set_policy_profile(
+            profile_id="profile-education",
+            context="education",
+            max_maturity_band="mature",
+            requires_confirmation_above=0.5,
+            requires_review_above=0.7,
+            blocked_labels=("gore",),
+            warning_labels=("violence",),
+        )
+
+        result = manager.check_content_against_profile(
+            profile_id="profile-education",
+            maturity_band="mature",
+            setting_values={},
+            detected_labels=["violence", "gore"],
+        )
+
+        assert result["violations"] == ["Blocked label detected: gore"]
+        assert result["warnings"] == ["violence"]
+        untouched = ContentGovernanceManager().check_content_against_profile(
+            profile_id="profile-education",
+            maturity_band="all_ages",
+            setting_values={},
+            detected_labels=["violence"],
+        )
+        assert untouched["allowed"] is False
+
     def test_high_intensity_settings_require_confirmation(self) -> None:
         """High-intensity settings require explicit confirmation."""
         manager = ContentGovernanceManager()
@@ -703,6 +991,30 @@ class TestG96MatureContentGovernance:
 
         assert result["requires_review"] is True
 
+    def test_batch_check_matches_single_checks(self) -> None:
+        """Batch checks agree with checking each item individually."""
+        manager = ContentGovernanceManager()
+        items = [
+            ("teen", {"violence": 0.9}, []),
+            ("mature", {"romance": 0.7}, ["violence", "explicit"]),
+            ("all_ages", {}, ["mature"]),
+        ]
+
+        results = manager.check_many_against_profile("profile-enterprise", items)
+
+        assert results == [
+            manager.check_content_against_profile("profile-enterprise", *item)
+            for item in items
+        ]
+        assert results[1]["violations"] == [
+            "Maturity band 'mature' exceeds profile maximum",
+            "Blocked label detected: explicit",
+        ]
+        assert results[1]["warnings"] == ["violence"]
+        assert manager.check_many_against_profile("profile-missing", items[:1]) == [
+            {"error": "Profile not found"}
+        ]
+
     def test_override_logging(self) -> None:
         """High-intensity overrides are logged with confirmation."""
         manager = ContentGovernanceManager()
@@ -838,3 +1150,53 @@ class TestPhase9DoneCriteria:
         metrics = engine.evaluate_phase9_done_criteria()
 
         assert metrics.active_kill_switches == 1
+
+    def test_phase9_metrics_cached_until_state_changes(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Metrics are reused until a manager mutates or a record expires."""
+        engine = OperationsEngine()
+
+        first = engine.evaluate_phase9_done_criteria()
+        assert engine.evaluate_phase9_done_criteria() is first
+
+        engine.capacity.trigger_kill_switch("kill-generation", "admin", "Test")
+        triggered = engine.evaluate_phase9_done_criteria()
+        assert triggered is not first
+        assert triggered.active_kill_switches == 1
+
+        engine.governance.submit_for_review(
+            "content-1", "scene", 0.9, ["mature"], "Borderline", "user"
+        )
+        assert engine.evaluate_phase9_done_criteria().pending_reviews == 1
+
+        engine.privacy.create_retention_record("temp", "temp-1", retention_days=1)
+        cached = engine.evaluate_phase9_done_criteria()
+        assert cached.expired_data_records == 0
+        assert engine.evaluate_phase9_done_criteria() is cached
+
+        # Two days later the record has expired without any manager changing.
+        later = datetime.now(UTC) + timedelta(days=2)
+
+        class _Later(datetime):
+            @classmethod
+            def now(cls, tz: tzinfo | None = None) -> _Later:
+                return cls.fromtimestamp(later.timestamp(), tz)
+
+        monkeypatch.setattr(operations_engine, "datetime", _Later)
+        assert engine.evaluate_phase9_done_criteria().expired_data_records == 1
+
+    def test_phase9_metrics_cached_with_live_latency_samples(self) -> None:
+        """SLO measurements taken while evaluating do not defeat the cache."""
+        engine = OperationsEngine()
+        engine.observability.record_latency("retrieval_latency", 500.0)
+
+        first = engine.evaluate_phase9_done_criteria()
+
+        assert first.slo_dashboards_active is True
+        assert first.breached_slo_count == 1
+        assert engine.evaluate_phase9_done_criteria() is first
+        assert engine.evaluate_phase9_done_criteria() is first
+
+        engine.observability.record_latency("retrieval_latency", 50.0)
+        assert engine.evaluate_phase9_done_criteria() is not first
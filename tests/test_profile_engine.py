@@ -18,10 +18,11 @@ from core.profile_engine import (
     evaluate_scene_label_predictions,
 )
 
+from _image_fixtures import Image
+
 
 def _create_checkerboard(path: Path, *, size: int = 120, block: int = 10) -> None:
-    image_module = __import__("PIL.Image", fromlist=["Image"])
-    image = image_module.new("RGB", (size, size), "white")
+    image = Image.new("RGB", (size, size), "white")
     pixels = image.load()
 
     for y_value in range(size):
@@ -35,8 +36,7 @@ def _create_checkerboard(path: Path, *, size: int = 120, block: int = 10) -> Non
 def _create_flat_image(
     path: Path, *, color: tuple[int, int, int], size: tuple[int, int]
 ) -> None:
-    image_module = __import__("PIL.Image", fromlist=["Image"])
-    image = image_module.new("RGB", size, color)
+    image = Image.new("RGB", size, color)
     image.save(path, format="PNG")
 
 
@@ -1166,6 +1166,7 @@ async def update_manga_volume(
         source_hash=volume.source_hash,
         pages=volume.pages,
         graph_node_id=request.graph_node_id if request.graph_node_id is not None else volume.graph_node_id,
+        listing_fingerprint=volume.listing_fingerprint,
         created_at=volume.created_at,
         updated_at=datetime.now(UTC).isoformat(),
     )